@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from runner import ROOT_PATH, Run, RunKind, RunTimeoutError, discover_solutions, get_runs, time_limit
+
+BASELINE_PATH = ROOT_PATH / 'benchmarks' / 'baseline.json'
+BENCHMARK_NAME_PATTERN = re.compile(pattern=r"^day(?P<day>\d+)\.p\d+:\w+@x(?P<scale>\d+)$")
+
+
+class Benchmark(BaseModel):
+    name: str
+    timings: list[float]
+    peak_memory: int
+
+    @property
+    def min(self) -> float:
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    @property
+    def p95(self) -> float:
+        if len(self.timings) < 2:
+            return self.timings[0]
+
+        return statistics.quantiles(self.timings, n=20, method='inclusive')[-1]
+
+    def to_baseline(self) -> dict[str, Any]:
+        return {
+            'min': self.min,
+            'median': self.median,
+            'p95': self.p95,
+            'peak_memory': self.peak_memory,
+            'repeats': len(self.timings),
+        }
+
+
+def get_scaled_run(run: Run, scale: int, seed: int, work_path: Path) -> Run | None:
+    if scale == 1:
+        return run
+
+    day = run.solution.split('.')[0]
+    try:
+        generator = importlib.import_module(f'{day}.generator')
+    except ModuleNotFoundError as e:
+        # Only a missing generator means the day cannot be scaled, a broken one has to fail
+        if e.name != f'{day}.generator':
+            raise
+
+        return None
+
+    input_path = work_path / f'{day}_x{scale}_{seed}.txt'
+    if not input_path.exists():
+        input_path.write_text(generator.generate(scale=scale, seed=seed))
+
+    kwargs = run.kwargs
+    if hasattr(generator, 'get_kwargs'):
+        # Generators describe every argument of the day, each part only takes the ones it uses
+        generated_kwargs = generator.get_kwargs(scale=scale)
+        kwargs = {key: generated_kwargs[key] for key in run.kwargs}
+
+    return run.model_copy(update={'input_path': input_path, 'kwargs': kwargs})
+
+
+def benchmark_run(
+        name: str,
+        run: Run,
+        repeats: int,
+        warmup: int,
+        timeout: float | None = None,
+) -> Benchmark:
+    module = importlib.import_module(run.solution)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(warmup):
+            with time_limit(seconds=timeout):
+                module.main(input_path=run.input_path, **run.kwargs)
+
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            with time_limit(seconds=timeout):
+                module.main(input_path=run.input_path, **run.kwargs)
+            timings.append(time.perf_counter() - start)
+
+        # Memory is measured on a separate pass since tracing distorts the timings
+        tracemalloc.start()
+        try:
+            with time_limit(seconds=timeout):
+                module.main(input_path=run.input_path, **run.kwargs)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return Benchmark(name=name, timings=timings, peak_memory=peak_memory)
+
+
+def get_regressions(
+        benchmarks: list[Benchmark],
+        baseline: dict[str, dict[str, Any]],
+        threshold: float,
+) -> list[str]:
+    regressions = []
+    for benchmark in benchmarks:
+        if benchmark.name not in baseline:
+            continue
+
+        baseline_median = baseline[benchmark.name]['median']
+        if benchmark.median > baseline_median * (1 + threshold):
+            regressions.append(
+                f'{benchmark.name}: median {baseline_median:.4f}s -> {benchmark.median:.4f}s '
+                f'({benchmark.median / baseline_median:.2f}x)',
+            )
+
+        baseline_memory = baseline[benchmark.name]['peak_memory']
+        if benchmark.peak_memory > baseline_memory * (1 + threshold):
+            regressions.append(
+                f'{benchmark.name}: peak memory {baseline_memory} -> {benchmark.peak_memory} bytes '
+                f'({benchmark.peak_memory / max(baseline_memory, 1):.2f}x)',
+            )
+
+    return regressions
+
+
+def get_missing(
+        benchmarks: list[Benchmark],
+        baseline: dict[str, dict[str, Any]],
+        days: list[int] | None,
+        scales: list[int],
+) -> list[str]:
+    # Baseline entries this sweep covers but did not measure, e.g. a removed or renamed solution
+    measured = {benchmark.name for benchmark in benchmarks}
+
+    missing = []
+    for name in sorted(baseline):
+        match = BENCHMARK_NAME_PATTERN.match(name)
+        if match is None or name in measured:
+            continue
+
+        if days and int(match.group('day')) not in days:
+            continue
+
+        if int(match.group('scale')) in scales:
+            missing.append(name)
+
+    return missing
+
+
+def print_benchmark(benchmark: Benchmark) -> None:
+    print(
+        f'{benchmark.name:<22} min {benchmark.min:>9.4f}s  median {benchmark.median:>9.4f}s  '
+        f'p95 {benchmark.p95:>9.4f}s  peak {benchmark.peak_memory / 1024:>10.1f}KiB',
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark solutions against a stored baseline.')
+    parser.add_argument('--days', type=int, nargs='*', help='only benchmark these days')
+    parser.add_argument('--repeats', type=int, default=5, help='timed runs per solution')
+    parser.add_argument('--warmup', type=int, default=1, help='untimed runs before measuring')
+    parser.add_argument('--scales', type=int, nargs='*', default=[1], help='input scales, 1 is the real input')
+    parser.add_argument('--seed', type=int, default=0, help='seed for generated inputs')
+    parser.add_argument('--timeout', type=float, help='per-run time limit in seconds')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown ratio over the baseline')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help='baseline json file')
+    parser.add_argument('--save', action='store_true', help='write the results as the new baseline')
+    args = parser.parse_args()
+
+    os.environ.setdefault('TQDM_DISABLE', '1')
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+
+    benchmarks = []
+    failures = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for solution in discover_solutions(days=args.days):
+            for run in get_runs(solution=solution, kinds=[RunKind.INPUT]):
+                for scale in args.scales:
+                    scaled_run = get_scaled_run(run=run, scale=scale, seed=args.seed, work_path=Path(work_dir))
+                    if scaled_run is None:
+                        continue
+
+                    name = f'{run.name}@x{scale}'
+                    try:
+                        benchmark = benchmark_run(
+                            name=name,
+                            run=scaled_run,
+                            repeats=args.repeats,
+                            warmup=args.warmup,
+                            timeout=args.timeout,
+                        )
+                    except RunTimeoutError:
+                        failures[name] = 'timeout'
+                        print(f'{name:<22} timeout')
+                        continue
+                    except Exception as e:
+                        failures[name] = f'error {e!r}'
+                        print(f'{name:<22} error {e!r}')
+                        continue
+
+                    print_benchmark(benchmark=benchmark)
+                    benchmarks.append(benchmark)
+
+    if args.save:
+        baseline.update({benchmark.name: benchmark.to_baseline() for benchmark in benchmarks})
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + '\n')
+        print(f'Saved {len(benchmarks)} benchmarks to {args.baseline}')
+        return 1 if failures else 0
+
+    regressions = get_regressions(benchmarks=benchmarks, baseline=baseline, threshold=args.threshold)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+
+    for name, failure in failures.items():
+        print(f'FAILED {name}: {failure}')
+
+    # Failed runs are already reported above, the rest never produced a run at all
+    missing = [
+        name
+        for name in get_missing(benchmarks=benchmarks, baseline=baseline, days=args.days, scales=args.scales)
+        if name not in failures
+    ]
+    for name in missing:
+        print(f'MISSING {name}: in the baseline but not benchmarked')
+
+    return 1 if regressions or failures or missing else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from mmap import mmap
+from typing import Iterator
+
+SENTINEL = 0
+
+
+class Grid:
+    """
+    Character grid stored row by row in a single bytearray.
+
+    Every side is padded with `padding` sentinel cells, so walking up to `padding` steps away from
+    any cell never leaves the buffer and needs no bounds check, the sentinel simply never matches.
+    A custom `stride` allows views over buffers with their own row separators, see `common.loader`.
+    """
+
+    def __init__(
+            self,
+            cells: bytearray | mmap,
+            width: int,
+            height: int,
+            padding: int = 1,
+            stride: int | None = None,
+    ) -> None:
+        self.cells: bytearray | mmap = cells
+        self.width: int = width
+        self.height: int = height
+        self.padding: int = padding
+        self.stride: int = stride if stride is not None else width + (2 * padding)
+        self.size: int = len(cells)
+
+        self.right: int = 1
+        self.left: int = -1
+        self.down: int = self.stride
+        self.up: int = -self.stride
+        self.neighbours: tuple[int, ...] = (self.right, self.down, self.left, self.up)
+        self.all_neighbours: tuple[int, ...] = (
+            self.right,
+            self.down + self.right,
+            self.down,
+            self.down + self.left,
+            self.left,
+            self.up + self.left,
+            self.up,
+            self.up + self.right,
+        )
+
+    @staticmethod
+    def from_lines(lines: list[str], padding: int = 1, sentinel: int = SENTINEL) -> Grid:
+        height = len(lines)
+        width = len(lines[0]) if lines else 0
+        stride = width + (2 * padding)
+
+        cells = bytearray([sentinel]) * (stride * (height + (2 * padding)))
+        for y, line in enumerate(lines):
+            encoded = line.encode()
+            # A slice assignment of another length would resize the buffer and shift every later row
+            if len(encoded) != width:
+                raise ValueError(f'line {y} is {len(encoded)} bytes long, expected {width}')
+
+            start = ((y + padding) * stride) + padding
+            cells[start:start + width] = encoded
+
+        return Grid(cells=cells, width=width, height=height, padding=padding)
+
+    def offset(self, dx: int, dy: int) -> int:
+        return (dy * self.stride) + dx
+
+    def index(self, x: int, y: int) -> int:
+        return ((y + self.padding) * self.stride) + x + self.padding
+
+    def position(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x - self.padding, y - self.padding
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[self.index(x=x, y=y)]
+
+    def set(self, x: int, y: int, value: int) -> None:
+        self.cells[self.index(x=x, y=y)] = value
+
+    def indices(self) -> Iterator[int]:
+        for y in range(self.height):
+            start = self.index(x=0, y=y)
+            yield from range(start, start + self.width)
+
+    def rows(self) -> Iterator[bytes | bytearray]:
+        for y in range(self.height):
+            start = self.index(x=0, y=y)
+            yield self.cells[start:start + self.width]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+
+import numpy as np
+
+from common.grid import Grid
+
+
+def map_file(input_path: Path) -> mmap.mmap:
+    with input_path.open('rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def map_grid(input_path: Path) -> Grid:
+    """
+    Memory-map a grid file and view it in place, without reading or copying it.
+
+    Rows keep their line breaks, so the grid has no padding and a stride of the line length plus
+    the line break. The line break acts as the sentinel for horizontal steps, stepping off the left
+    edge lands on the previous row's line break, while vertical steps past the first or last row
+    leave the buffer and have to be checked with `0 <= index < grid.size`.
+    """
+    cells = map_file(input_path=input_path)
+
+    width = cells.find(b'\n')
+    if width == -1:
+        return Grid(cells=cells, width=len(cells), height=1, padding=0, stride=len(cells) + 1)
+
+    stride = width + 1
+    if width > 0 and cells[width - 1] == ord('\r'):
+        width -= 1
+
+    # The last line may or may not end with a line break
+    height = (len(cells) + stride - 1) // stride
+    return Grid(cells=cells, width=width, height=height, padding=0, stride=stride)
+
+
+def map_array(input_path: Path) -> np.ndarray:
+    """
+    Memory-map a grid file as a read-only `(height, width)` uint8 array, skipping the line breaks
+    through the row stride rather than copying the rows out.
+    """
+    grid = map_grid(input_path=input_path)
+    return np.ndarray(
+        shape=(grid.height, grid.width),
+        dtype=np.uint8,
+        buffer=grid.cells,
+        strides=(grid.stride, 1),
+    )
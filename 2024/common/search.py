@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Iterator, NamedTuple
+
+from common.grid import Grid
+
+# Word, start (x, y) and step (dx, dy) of a match
+MATCH_TYPE = tuple[str, int, int, int, int]
+
+
+class SearchResult(NamedTuple):
+    # Not a validated model, large grids produce millions of positions
+    counts: dict[str, int]
+    positions: dict[str, list[tuple[int, int, int, int]]]
+
+
+class WordSearch:
+    """
+    Multi-word grid search over an Aho-Corasick automaton.
+
+    Every row, column and diagonal of the grid is streamed through the automaton once. Lines are
+    only read forwards, the backward directions are covered by also matching each reversed word.
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words: list[str] = list(dict.fromkeys(words))
+
+        self.goto: list[dict[int, int]] = [{}]
+        self.fail: list[int] = [0]
+        # Per state: (word, pattern length, is_reversed) of every pattern ending there
+        self.outputs: list[list[tuple[str, int, bool]]] = [[]]
+
+        self.setup_automaton()
+
+    def setup_automaton(self) -> None:
+        for word in self.words:
+            self._add_pattern(pattern=word.encode(), output=(word, len(word), False))
+            # Palindromes get both entries, they do read the same way in both directions
+            self._add_pattern(pattern=word[::-1].encode(), output=(word, len(word), True))
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for value, next_state in self.goto[state].items():
+                queue.append(next_state)
+
+                fail_state = self.fail[state]
+                while fail_state and value not in self.goto[fail_state]:
+                    fail_state = self.fail[fail_state]
+
+                self.fail[next_state] = self.goto[fail_state].get(value, 0)
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+
+    def _add_pattern(self, pattern: bytes, output: tuple[str, int, bool]) -> None:
+        state = 0
+        for value in pattern:
+            if value not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+                self.goto[state][value] = len(self.goto) - 1
+
+            state = self.goto[state][value]
+
+        self.outputs[state].append(output)
+
+    def search(self, grid: Grid, positions: bool = False) -> SearchResult:
+        counts = dict.fromkeys(self.words, 0)
+        found_positions = {word: [] for word in self.words} if positions else {}
+
+        for word, x, y, dx, dy in self.iter_matches(grid=grid):
+            counts[word] += 1
+            if positions:
+                found_positions[word].append((x, y, dx, dy))
+
+        return SearchResult(counts=counts, positions=found_positions)
+
+    def iter_matches(self, grid: Grid) -> Iterator[MATCH_TYPE]:
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        cells = grid.cells
+
+        for line, (dx, dy) in self._iter_lines(grid=grid):
+            state = 0
+            for i, index in enumerate(line):
+                value = cells[index]
+                while state and value not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(value, 0)
+
+                for word, length, is_reversed in outputs[state]:
+                    if is_reversed:
+                        # Read backwards, the word starts on the current cell
+                        x, y = grid.position(index=index)
+                        yield word, x, y, -dx, -dy
+                    else:
+                        x, y = grid.position(index=line[i - length + 1])
+                        yield word, x, y, dx, dy
+
+    @staticmethod
+    def _iter_lines(grid: Grid) -> Iterator[tuple[range, tuple[int, int]]]:
+        width, height, stride = grid.width, grid.height, grid.stride
+        if not width or not height:
+            return
+
+        for y in range(height):
+            start = grid.index(x=0, y=y)
+            yield range(start, start + width), (1, 0)
+
+        for x in range(width):
+            start = grid.index(x=x, y=0)
+            yield range(start, start + (height * stride), stride), (0, 1)
+
+        # Diagonals going down-right start on the left column or the top row
+        for start_x, start_y in [(0, y) for y in range(height - 1, 0, -1)] + [(x, 0) for x in range(width)]:
+            length = min(width - start_x, height - start_y)
+            start = grid.index(x=start_x, y=start_y)
+            yield range(start, start + (length * (stride + 1)), stride + 1), (1, 1)
+
+        # Diagonals going down-left start on the top row or the right column
+        for start_x, start_y in [(x, 0) for x in range(width)] + [(width - 1, y) for y in range(1, height)]:
+            length = min(start_x + 1, height - start_y)
+            start = grid.index(x=start_x, y=start_y)
+            if length == 1:
+                # Unpadded single column grids have a stride of 1, which would make the step zero
+                yield range(start, start + 1), (-1, 1)
+            else:
+                yield range(start, start + (length * (stride - 1)), stride - 1), (-1, 1)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+# Steps of the arrow characters the puzzles use for directions
+DIRECTION_STEPS: dict[str, tuple[int, int]] = {
+    '>': (1, 0),
+    '<': (-1, 0),
+    '^': (0, -1),
+    'v': (0, 1),
+}
+
+
+class Coordinates(NamedTuple):
+    """
+    Immutable (x, y) pair for simulation loops.
+
+    A tuple rather than a validated model, so creating one per step is cheap and it hashes and
+    compares like the plain `(x, y)` tuples used as keys elsewhere.
+    """
+
+    x: int
+    y: int
+
+    def get_next_coordinates(self, direction: str) -> Coordinates:
+        dx, dy = DIRECTION_STEPS[direction]
+        # Keeps the type of subclasses that add puzzle specific methods
+        return type(self)(self.x + dx, self.y + dy)
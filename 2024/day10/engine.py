@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from common.grid import Grid
+
+TRAILHEAD_HEIGHT = 0
+SUMMIT_HEIGHT = 9
+DIGIT_0 = ord('0')
+
+# Bit of a summit seen from its own cell, the centre of the offset window
+SUMMIT_WINDOW = (2 * (SUMMIT_HEIGHT - TRAILHEAD_HEIGHT)) + 1
+SUMMIT_BIT = 1 << (((SUMMIT_WINDOW * SUMMIT_WINDOW) - 1) // 2)
+
+
+def get_height_buckets(grid: Grid) -> list[list[int]]:
+    result = [[] for _ in range(SUMMIT_HEIGHT + 1)]
+    cells = grid.cells
+    for index in grid.indices():
+        height = cells[index] - DIGIT_0
+        if TRAILHEAD_HEIGHT <= height <= SUMMIT_HEIGHT:
+            result[height].append(index)
+
+    return result
+
+
+def get_trail_ratings(grid: Grid) -> dict[int, int]:
+    """
+    Number of distinct hiking trails from every trailhead.
+
+    Heights are swept once from the summits down, each cell summing the counts of its neighbours
+    one level up. Only that level is kept, keyed by cell index, so a neighbour that is not in it
+    is either lower, higher or outside the grid and needs no further check.
+    """
+    buckets = get_height_buckets(grid=grid)
+
+    paths = {index: 1 for index in buckets[SUMMIT_HEIGHT]}
+    for height in range(SUMMIT_HEIGHT - 1, TRAILHEAD_HEIGHT - 1, -1):
+        upper_paths = paths
+        paths = {}
+        for index in buckets[height]:
+            total = 0
+            for direction in grid.neighbours:
+                total += upper_paths.get(index + direction, 0)
+            paths[index] = total
+
+    return paths
+
+
+def get_trail_scores(grid: Grid) -> dict[int, int]:
+    """
+    Number of distinct summits reachable from every trailhead.
+
+    Same sweep as `get_trail_ratings`, but each cell keeps the summits it reaches as an integer
+    bitset. A summit's bit encodes its offset from the cell inside a window of `SUMMIT_WINDOW`
+    cells per side, which always fits since a summit is at most 9 steps away. Taking a bitset
+    from a neighbour only shifts it by that neighbour's offset, and bitsets stay a few machine
+    words long no matter how many summits the map has.
+    """
+    buckets = get_height_buckets(grid=grid)
+
+    shifts = [
+        (grid.right, 1),
+        (grid.down, SUMMIT_WINDOW),
+        (grid.left, -1),
+        (grid.up, -SUMMIT_WINDOW),
+    ]
+
+    summits = {index: SUMMIT_BIT for index in buckets[SUMMIT_HEIGHT]}
+    for height in range(SUMMIT_HEIGHT - 1, TRAILHEAD_HEIGHT - 1, -1):
+        upper_summits = summits
+        summits = {}
+        for index in buckets[height]:
+            reachable = 0
+            for direction, shift in shifts:
+                upper_reachable = upper_summits.get(index + direction, 0)
+                if shift > 0:
+                    reachable |= upper_reachable << shift
+                else:
+                    reachable |= upper_reachable >> -shift
+            summits[index] = reachable
+
+    return {index: reachable.bit_count() for index, reachable in summits.items()}
@@ -0,0 +1,38 @@
+import argparse
+import math
+import random
+import sys
+
+SIZE = 41
+TRAIL_DENSITY = 0.1
+
+
+def get_size(scale: int) -> int:
+    return max(2, round(SIZE * math.sqrt(scale)))
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = get_size(scale=scale)
+
+    matrix = [[rng.randrange(10) for _ in range(size)] for _ in range(size)]
+
+    # Random noise barely has any trails, so climb some from random trailheads
+    for _ in range(round(size * size * TRAIL_DENSITY / 10)):
+        x, y = rng.randrange(size), rng.randrange(size)
+        for height in range(10):
+            matrix[y][x] = height
+            next_x, next_y = rng.choice([(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)])
+            if not (0 <= next_x < size and 0 <= next_y < size):
+                break
+            x, y = next_x, next_y
+
+    return '\n'.join(''.join(str(x) for x in row) for row in matrix) + '\n'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a topographic map.')
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(scale=args.scale, seed=args.seed))
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
+from math import isqrt
+from operator import mul
+
+import numpy as np
+from tqdm import tqdm
+
+# Covers every stone the puzzle produces, larger ones fall back to counting the digits of a string
+POWERS_OF_TEN = [10 ** i for i in range(100)]
+PRECOMPUTED_STONES = 1 << 14
+TRANSITION_CACHE_SIZE = 1 << 16
+MAX_CLOSURE_SIZE = 1 << 16
+MODULUS = 1_000_000_007
+
+
+def get_stones(line: str) -> list[int]:
+    return [int(x) for x in line.split()]
+
+
+def get_digit_count(stone: int) -> int:
+    if stone >= POWERS_OF_TEN[-1]:
+        return len(str(stone))
+
+    return bisect_right(POWERS_OF_TEN, stone)
+
+
+def get_stone_transition(stone: int) -> tuple[int, ...]:
+    if stone == 0:
+        return (1,)
+
+    digit_count = get_digit_count(stone)
+    if digit_count % 2 == 0:
+        half = digit_count // 2
+        return divmod(stone, POWERS_OF_TEN[half] if half < len(POWERS_OF_TEN) else 10 ** half)
+
+    return (stone * 2024,)
+
+
+TRANSITIONS = [get_stone_transition(stone) for stone in range(PRECOMPUTED_STONES)]
+
+
+@lru_cache(maxsize=TRANSITION_CACHE_SIZE)
+def get_cached_stone_transition(stone: int) -> tuple[int, ...]:
+    return get_stone_transition(stone)
+
+
+def get_next_stones(stone: int) -> tuple[int, ...]:
+    if stone < PRECOMPUTED_STONES:
+        return TRANSITIONS[stone]
+
+    return get_cached_stone_transition(stone)
+
+
+class StoneSimulator:
+    """
+    Stones as a multiset: stones with the same value always change the same way, so only the
+    distinct values and how many stones carry each of them are tracked.
+    """
+
+    def __init__(self, stones: list[int]) -> None:
+        self.counts: Counter[int] = Counter(stones)
+        # Distinct values after every blink, starting with the initial stones
+        self.distinct_counts: list[int] = [len(self.counts)]
+
+    def blink(self) -> None:
+        next_counts: Counter[int] = Counter()
+        for stone, count in self.counts.items():
+            if stone < PRECOMPUTED_STONES:
+                next_stones = TRANSITIONS[stone]
+            else:
+                next_stones = get_cached_stone_transition(stone)
+
+            for next_stone in next_stones:
+                next_counts[next_stone] += count
+
+        self.counts = next_counts
+        self.distinct_counts.append(len(next_counts))
+
+    def run(self, blinks: int) -> int:
+        for _ in tqdm(range(blinks)):
+            self.blink()
+
+        return self.get_stone_count()
+
+    def get_stone_count(self) -> int:
+        return sum(self.counts.values())
+
+
+def is_prime(number: int) -> bool:
+    if number < 2:
+        return False
+
+    return all(number % divisor for divisor in range(2, isqrt(number) + 1))
+
+
+def get_stone_closure(stones: list[int]) -> list[int]:
+    values = list(dict.fromkeys(stones))
+    seen = set(values)
+    for stone in values:
+        for next_stone in get_next_stones(stone):
+            if next_stone not in seen:
+                seen.add(next_stone)
+                values.append(next_stone)
+
+        if len(values) > MAX_CLOSURE_SIZE:
+            raise ValueError(f'stone values do not close within {MAX_CLOSURE_SIZE} distinct values')
+
+    return values
+
+
+def get_recurrence(terms: list[int], modulus: int) -> list[int]:
+    # Berlekamp-Massey: shortest c so that terms[n] = sum(c[i] * terms[n - 1 - i]) for n >= len(c)
+    connection, previous = [1], [1]
+    length, shift, previous_discrepancy = 0, 1, 1
+    for n, term in enumerate(terms):
+        discrepancy = (term + sum(map(mul, connection[1:length + 1], terms[n - 1::-1]))) % modulus
+        if discrepancy == 0:
+            shift += 1
+            continue
+
+        factor = discrepancy * pow(previous_discrepancy, -1, modulus) % modulus
+        updated = connection + [0] * max(0, len(previous) + shift - len(connection))
+        for i, value in enumerate(previous):
+            updated[i + shift] = (updated[i + shift] - factor * value) % modulus
+
+        if 2 * length <= n:
+            previous, previous_discrepancy = connection, discrepancy
+            length, shift = n + 1 - length, 1
+        else:
+            shift += 1
+        connection = updated
+
+    connection += [0] * (length + 1 - len(connection))
+    return [-value % modulus for value in connection[1:length + 1]]
+
+
+class StoneFastForward:
+    """
+    Stone counts modulo a prime for huge blink counts, through their linear recurrence.
+    """
+
+    def __init__(self, stones: list[int], modulus: int = MODULUS) -> None:
+        # Counts are summed as float64 by `np.bincount`, which stays exact below 2 ** 53, and
+        # Berlekamp-Massey divides by discrepancies, so every non-zero residue must be invertible
+        if modulus >= 1 << 31 or not is_prime(modulus):
+            raise ValueError(f'modulus must be a prime below 2 ** 31, got {modulus}')
+
+        self.modulus = modulus
+        self.values = get_stone_closure(stones=stones)
+
+        indices = {stone: index for index, stone in enumerate(self.values)}
+        # Sparse transition matrix as (source, target) index pairs, one per produced stone
+        self.sources = np.array(
+            [indices[stone] for stone in self.values for _ in get_next_stones(stone)],
+            dtype=np.int64,
+        )
+        self.targets = np.array(
+            [indices[next_stone] for stone in self.values for next_stone in get_next_stones(stone)],
+            dtype=np.int64,
+        )
+
+        self.initial_counts = np.zeros(len(self.values), dtype=np.int64)
+        for stone in stones:
+            self.initial_counts[indices[stone]] += 1
+
+        # The recurrence order is at most the closure size, twice as many terms pin it down
+        self.terms = self.get_terms(blinks=2 * len(self.values))
+        self.coefficients = np.array(get_recurrence(terms=self.terms, modulus=modulus), dtype=np.int64)
+
+    def get_terms(self, blinks: int) -> list[int]:
+        counts = self.initial_counts % self.modulus
+        terms = []
+        for _ in range(blinks):
+            terms.append(int(counts.sum()) % self.modulus)
+            weights = counts[self.sources].astype(np.float64)
+            counts = np.bincount(self.targets, weights=weights, minlength=len(counts)).astype(np.int64)
+            counts %= self.modulus
+
+        return terms
+
+    def get_stone_count(self, blinks: int) -> int:
+        if blinks < len(self.terms):
+            return self.terms[blinks]
+
+        order = len(self.coefficients)
+        if not order:
+            return 0
+
+        # Coefficients of x ** blinks reduced to the span of x ** 0 .. x ** (order - 1)
+        polynomial = np.zeros(order, dtype=np.int64)
+        polynomial[0] = 1
+        for bit in bin(blinks)[2:]:
+            polynomial = self._reduce(self._square(polynomial))
+            if bit == '1':
+                polynomial = self._reduce(np.concatenate(([0], polynomial)))
+
+        return sum(map(mul, polynomial.tolist(), self.terms)) % self.modulus
+
+    def _square(self, polynomial: np.ndarray) -> np.ndarray:
+        result = np.zeros(2 * len(polynomial) - 1, dtype=np.int64)
+        for i, value in enumerate(polynomial):
+            if value:
+                # Both factors are below 2 ** 31, so one product plus the running sum fits int64
+                result[i:i + len(polynomial)] = (result[i:i + len(polynomial)] + value * polynomial) % self.modulus
+
+        return result
+
+    def _reduce(self, polynomial: np.ndarray) -> np.ndarray:
+        # x ** order == sum(coefficients[i] * x ** (order - 1 - i)), folded from the top down
+        order = len(self.coefficients)
+        polynomial = polynomial.copy()
+        for degree in range(len(polynomial) - 1, order - 1, -1):
+            value = polynomial[degree]
+            if value:
+                window = polynomial[degree - order:degree]
+                window[:] = (window + value * self.coefficients[::-1]) % self.modulus
+
+        return polynomial[:order]
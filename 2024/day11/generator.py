@@ -0,0 +1,19 @@
+import argparse
+import random
+import sys
+
+STONES = 8
+MAX_STONE = 10_000_000
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return ' '.join(str(rng.randrange(MAX_STONE)) for _ in range(STONES * scale))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a line of stones.')
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(scale=args.scale, seed=args.seed))
@@ -1,35 +1,22 @@
+import sys
 from pathlib import Path
 
-from tqdm import tqdm
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from day11.engine import StoneFastForward, StoneSimulator, get_stones  # noqa: E402
 
-def get_stones(line: str) -> list[int]:
-    return [int(x) for x in line.split()]
+BLINKS = 25
 
 
-def blink(stones: list[int]) -> list[int]:
-    result = []
-    for stone in stones:
-        if stone == 0:
-            result.append(1)
-            continue
-
-        stone_str = str(stone)
-        if len(stone_str) % 2 == 0:
-            result.append(int(stone_str[:len(stone_str) // 2]))
-            result.append(int(stone_str[len(stone_str) // 2:]))
-            continue
-
-        result.append(stone * 2024)
-
-    return result
-
-def main(input_path: Path) -> int:
+def main(input_path: Path, blinks: int = BLINKS, modulus: int | None = None) -> int:
     line = input_path.read_text()
     stones = get_stones(line=line)
-    for _ in tqdm(range(25)):
-        stones = blink(stones=stones)
-    return len(stones)
+    if modulus is not None:
+        return StoneFastForward(stones=stones, modulus=modulus).get_stone_count(blinks=blinks)
+
+    simulator = StoneSimulator(stones=stones)
+    return simulator.run(blinks=blinks)
+
 
 if __name__ == '__main__':
     sample_result = main(
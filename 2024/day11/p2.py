@@ -1,43 +1,21 @@
+import sys
 from pathlib import Path
 
-from tqdm import tqdm
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from day11.engine import MODULUS, StoneFastForward, StoneSimulator, get_stones  # noqa: E402
 
-def get_stones(line: str) -> list[int]:
-    return [int(x) for x in line.split()]
+BLINKS = 75
 
 
-def get_final_count(cache: dict[tuple[int, int], int], stone: int, blinks: int) -> int:
-    if blinks == 0:
-        return 1
-
-    if (stone, blinks) in cache:
-        return cache[(stone, blinks)]
-
-    if stone == 0:
-        cache[(stone, blinks)] = get_final_count(cache=cache, stone=1, blinks=blinks - 1)
-        return cache[(stone, blinks)]
-
-    stone_str = str(stone)
-    if len(stone_str) % 2 == 0:
-        mid_point = len(stone_str) // 2
-        first_part = get_final_count(cache=cache, stone=int(stone_str[:mid_point]), blinks=blinks - 1)
-        second_part = get_final_count(cache=cache, stone=int(stone_str[mid_point:]), blinks=blinks - 1)
-        cache[(stone, blinks)] = first_part + second_part
-        return cache[(stone, blinks)]
-
-    cache[(stone, blinks)] = get_final_count(cache=cache, stone=stone * 2024, blinks=blinks - 1)
-    return cache[(stone, blinks)]
-
-
-def main(input_path: Path) -> int:
+def main(input_path: Path, blinks: int = BLINKS, modulus: int | None = None) -> int:
     line = input_path.read_text()
     stones = get_stones(line=line)
-    cache = {}
-    result = 0
-    for stone in stones:
-        result += get_final_count(cache=cache, stone=stone, blinks=75)
-    return result
+    if modulus is not None:
+        return StoneFastForward(stones=stones, modulus=modulus).get_stone_count(blinks=blinks)
+
+    simulator = StoneSimulator(stones=stones)
+    return simulator.run(blinks=blinks)
 
 
 if __name__ == '__main__':
@@ -47,6 +25,9 @@ if __name__ == '__main__':
     print(f'Sample Result: {sample_result}')
     assert sample_result == 65601038650482
 
+    # Past the blinks the recurrence is recovered from, so the fast-forward is really used
+    assert main(input_path=Path('data/sample.txt'), blinks=500, modulus=MODULUS) == 970983047
+
     input_result = main(
         input_path=Path('data/input.txt'),
     )
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from array import array
+
+import numpy as np
+
+from common.grid import Grid
+
+NO_LABEL = -1
+
+
+def get_root(parents: array, label: int) -> int:
+    while parents[label] != label:
+        # Path halving, every visited label skips to its grandparent
+        parents[label] = parents[parents[label]]
+        label = parents[label]
+
+    return label
+
+
+class Garden:
+    """
+    Garden plots labelled by region, in a flat array sharing the padded grid's indices.
+    """
+
+    def __init__(self, grid: Grid) -> None:
+        self.grid: Grid = grid
+        self.labels: array = array('i', [NO_LABEL]) * grid.size
+        self.areas: list[int] = []
+        self.perimeters: list[int] = []
+        self.fence_price: int = 0
+        # Only known once part 2 prices are asked for, kept up to date by `update_cell` from then on
+        self.sides: list[int] | None = None
+        self.bulk_fence_price: int | None = None
+
+        self.setup_labels()
+
+    @staticmethod
+    def from_lines(lines: list[str]) -> Garden:
+        return Garden(grid=Grid.from_lines(lines=lines, padding=1))
+
+    def setup_labels(self) -> None:
+        cells, labels, grid = self.grid.cells, self.labels, self.grid
+        left, up = grid.left, grid.up
+
+        parents = array('i')
+        for index in grid.indices():
+            code = cells[index]
+            if cells[index + left] == code:
+                label = labels[index + left]
+                if cells[index + up] == code:
+                    up_root = get_root(parents=parents, label=labels[index + up])
+                    root = get_root(parents=parents, label=label)
+                    if up_root != root:
+                        parents[max(up_root, root)] = min(up_root, root)
+            elif cells[index + up] == code:
+                label = labels[index + up]
+            else:
+                label = len(parents)
+                parents.append(label)
+
+            labels[index] = label
+
+        regions = array('i', [NO_LABEL]) * len(parents)
+        areas, perimeters = self.areas, self.perimeters
+        neighbours = grid.neighbours
+        for index in grid.indices():
+            root = get_root(parents=parents, label=labels[index])
+            region = regions[root]
+            if region == NO_LABEL:
+                region = regions[root] = len(areas)
+                areas.append(0)
+                perimeters.append(0)
+
+            labels[index] = region
+            areas[region] += 1
+
+            # Neighbouring plots of the same type are always in the same region
+            code = cells[index]
+            for offset in neighbours:
+                if cells[index + offset] != code:
+                    perimeters[region] += 1
+
+        self.fence_price = sum(area * perimeter for area, perimeter in zip(areas, perimeters))
+
+    def setup_sides(self) -> None:
+        self.sides = self.get_sides()
+        self.bulk_fence_price = sum(area * sides for area, sides in zip(self.areas, self.sides))
+
+    @property
+    def region_count(self) -> int:
+        return len(self.areas)
+
+    def get_sides(self) -> list[int]:
+        """
+        Sides per region, counted as the corners in every 2x2 window of labels.
+        """
+        labels = np.frombuffer(self.labels, dtype=np.int32).reshape(-1, self.grid.stride)
+        top_left, top_right = labels[:-1, :-1], labels[:-1, 1:]
+        bottom_left, bottom_right = labels[1:, :-1], labels[1:, 1:]
+
+        sides = np.zeros(self.region_count, dtype=np.int64)
+        for cell, horizontal, vertical, diagonal in (
+                (top_left, top_right, bottom_left, bottom_right),
+                (top_right, top_left, bottom_right, bottom_left),
+                (bottom_left, bottom_right, top_left, top_right),
+                (bottom_right, bottom_left, top_right, top_left),
+        ):
+            same_horizontal = horizontal == cell
+            same_vertical = vertical == cell
+            convex = ~same_horizontal & ~same_vertical
+            concave = same_horizontal & same_vertical & (diagonal != cell)
+            corners = cell[(convex | concave) & (cell != NO_LABEL)]
+            sides += np.bincount(corners, minlength=self.region_count)
+
+        return sides.tolist()
+
+    def get_fence_price(self) -> int:
+        return self.fence_price
+
+    def get_bulk_fence_price(self) -> int:
+        if self.sides is None:
+            self.setup_sides()
+
+        return self.bulk_fence_price
+
+    def update_cell(self, x: int, y: int, new_code: str) -> tuple[int, int]:
+        """
+        Change the plant type of one plot and return the new (part 1, part 2) prices.
+        """
+        grid, cells, labels = self.grid, self.grid.cells, self.labels
+        # Checked before anything changes, a failed edit must leave the garden as it was
+        if not grid.contains(x=x, y=y):
+            raise ValueError(f'plot ({x}, {y}) is outside the {grid.width}x{grid.height} garden')
+
+        if len(new_code) != 1 or not new_code.isascii() or not new_code.isprintable():
+            raise ValueError(f'plant type must be a single printable ASCII character, got {new_code!r}')
+
+        if self.sides is None:
+            self.setup_sides()
+
+        index = grid.index(x=x, y=y)
+        code = ord(new_code)
+        if cells[index] != code:
+            old_code = cells[index]
+            affected_labels = {labels[index]} | {
+                labels[index + offset] for offset in grid.neighbours if cells[index + offset] == code
+            }
+            for label in affected_labels:
+                self.fence_price -= self.areas[label] * self.perimeters[label]
+                self.bulk_fence_price -= self.areas[label] * self.sides[label]
+                self.areas[label] = self.perimeters[label] = self.sides[label] = 0
+
+            cells[index] = code
+
+            # The old region may fall apart into one component per remaining neighbour
+            seeds = [index] + [index + offset for offset in grid.neighbours if cells[index + offset] == old_code]
+            free_labels = sorted(affected_labels, reverse=True)
+            visited = set()
+            components = []
+            for seed in seeds:
+                if seed in visited:
+                    continue
+
+                label = free_labels.pop() if free_labels else self._add_region()
+                components.append((label, self._relabel(start=seed, label=label, visited=visited)))
+
+            # Corners compare against neighbouring labels, so every component is relabelled first
+            for label, component in components:
+                self._measure(label=label, component=component)
+                self.fence_price += self.areas[label] * self.perimeters[label]
+                self.bulk_fence_price += self.areas[label] * self.sides[label]
+
+        return self.fence_price, self.bulk_fence_price
+
+    def _add_region(self) -> int:
+        self.areas.append(0)
+        self.perimeters.append(0)
+        self.sides.append(0)
+        return len(self.areas) - 1
+
+    def _relabel(self, start: int, label: int, visited: set[int]) -> list[int]:
+        cells, labels, neighbours = self.grid.cells, self.labels, self.grid.neighbours
+
+        code = cells[start]
+        component = [start]
+        visited.add(start)
+        for index in component:
+            labels[index] = label
+            for offset in neighbours:
+                neighbour = index + offset
+                if cells[neighbour] == code and neighbour not in visited:
+                    visited.add(neighbour)
+                    component.append(neighbour)
+
+        return component
+
+    def _measure(self, label: int, component: list[int]) -> None:
+        grid, cells, labels = self.grid, self.grid.cells, self.labels
+        corners = (
+            (grid.left, grid.up),
+            (grid.right, grid.up),
+            (grid.left, grid.down),
+            (grid.right, grid.down),
+        )
+
+        perimeter = sides = 0
+        for index in component:
+            code = cells[index]
+            for offset in grid.neighbours:
+                if cells[index + offset] != code:
+                    perimeter += 1
+
+            for horizontal, vertical in corners:
+                same_horizontal = labels[index + horizontal] == label
+                same_vertical = labels[index + vertical] == label
+                if not same_horizontal and not same_vertical:
+                    sides += 1
+                elif same_horizontal and same_vertical and labels[index + horizontal + vertical] != label:
+                    sides += 1
+
+        self.areas[label] = len(component)
+        self.perimeters[label] = perimeter
+        self.sides[label] = sides
@@ -0,0 +1,41 @@
+import argparse
+import math
+import random
+import string
+import sys
+
+SIZE = 140
+# Chance of a plot continuing the region of its left or top neighbour
+GROWTH = 0.9
+
+
+def get_size(scale: int) -> int:
+    return max(2, round(SIZE * math.sqrt(scale)))
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = get_size(scale=scale)
+
+    matrix = []
+    for y in range(size):
+        row = []
+        for x in range(size):
+            if rng.random() >= GROWTH or (x == 0 and y == 0):
+                row.append(rng.choice(string.ascii_uppercase))
+            elif y == 0 or (x > 0 and rng.random() < 0.5):
+                row.append(row[x - 1])
+            else:
+                row.append(matrix[y - 1][x])
+
+        matrix.append(row)
+
+    return '\n'.join(''.join(row) for row in matrix) + '\n'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a garden map.')
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(scale=args.scale, seed=args.seed))
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import re
+from operator import itemgetter
+from typing import NamedTuple
+
+import numpy as np
+
+from common.values import Coordinates
+
+PUZZLE_PATTERN = re.compile(
+    pattern=r"Button (?P<button_name_1>.+): X\+(?P<button_x_step_1>\d+), Y\+(?P<button_y_step_1>\d+)\nButton (?P<button_name_2>.+): X\+(?P<button_x_step_2>\d+), Y\+(?P<button_y_step_2>\d+)\nPrize: X=(?P<prize_x>\d+), Y=(?P<prize_y>\d+)",
+)
+
+BUTTON_TOKENS_MAPPING = {
+    "A": 3,
+    "B": 1,
+}
+
+# Bound on the Cramer numerator products and the token total, leaving a bit for their sums
+INT64_PRODUCT_LIMIT = 1 << 62
+# Numbers NumPy could not parse into int64, it saturates them instead of failing
+LONG_NUMBER_PATTERN = re.compile(pattern=r"\d{19,}")
+
+
+class Button(NamedTuple):
+    name: str
+    tokens: int
+    x_step: int
+    y_step: int
+
+
+Location = Coordinates
+
+
+class Puzzle(NamedTuple):
+    buttons: tuple[Button, Button]
+    prize: Location
+
+
+def get_puzzles(input_text: str, drift: int = 0) -> list[Puzzle]:
+    puzzles = []
+
+    matches = PUZZLE_PATTERN.finditer(input_text)
+    for match in matches:
+        puzzles.append(
+            Puzzle(
+                buttons=(
+                    Button(
+                        name=match.group("button_name_1"),
+                        tokens=BUTTON_TOKENS_MAPPING[match.group("button_name_1")],
+                        x_step=int(match.group("button_x_step_1")),
+                        y_step=int(match.group("button_y_step_1")),
+                    ),
+                    Button(
+                        name=match.group("button_name_2"),
+                        tokens=BUTTON_TOKENS_MAPPING[match.group("button_name_2")],
+                        x_step=int(match.group("button_x_step_2")),
+                        y_step=int(match.group("button_y_step_2")),
+                    ),
+                ),
+                prize=Location(
+                    x=int(match.group("prize_x")) + drift,
+                    y=int(match.group("prize_y")) + drift,
+                )
+            ),
+        )
+
+    return puzzles
+
+
+def get_extended_gcd(a: int, b: int) -> tuple[int, int, int]:
+    """
+    Return (g, s, t) with g = gcd(a, b) = (s * a) + (t * b).
+    """
+    s, previous_s = 0, 1
+    t, previous_t = 1, 0
+    while b:
+        quotient, remainder = divmod(a, b)
+        a, b = b, remainder
+        previous_s, s = s, previous_s - (quotient * s)
+        previous_t, t = t, previous_t - (quotient * t)
+
+    return a, previous_s, previous_t
+
+
+def get_minimum_tokens(puzzle: Puzzle) -> int | None:
+    """
+    (a * x0) + (b * x1) = xt
+    (a * y0) + (b * y1) = yt
+
+    a = ((xt * y1) - (x1 * yt)) / d
+    b = ((x0 * yt) - (y0 * xt)) / d
+    d = (x0 * y1) - (y0 * x1)
+
+    Both divisions are done with `divmod`, so the presses are exact integers at any prize scale.
+    """
+    button_a, button_b = puzzle.buttons
+    xt, yt = puzzle.prize.x, puzzle.prize.y
+    x0, y0 = button_a.x_step, button_a.y_step
+    x1, y1 = button_b.x_step, button_b.y_step
+
+    d = (x0 * y1) - (y0 * x1)
+    if d == 0:
+        return get_collinear_minimum_tokens(
+            button_a=(x0, y0, button_a.tokens),
+            button_b=(x1, y1, button_b.tokens),
+            prize=(xt, yt),
+        )
+
+    a, a_remainder = divmod((xt * y1) - (x1 * yt), d)
+    b, b_remainder = divmod((x0 * yt) - (y0 * xt), d)
+    if a_remainder or b_remainder or a < 0 or b < 0:
+        return None
+
+    return (button_a.tokens * a) + (button_b.tokens * b)
+
+
+def get_collinear_minimum_tokens(
+        button_a: tuple[int, int, int],
+        button_b: tuple[int, int, int],
+        prize: tuple[int, int],
+) -> int | None:
+    """
+    Both buttons move along the same line, so the prize has to be on it too and every press
+    combination solves a single equation (a * s0) + (b * s1) = st along one axis.
+
+    Its integer solutions are a = a0 + (k * s1 / g), b = b0 - (k * s0 / g) for the extended GCD
+    solution (a0, b0). Tokens change linearly with k, so the cheapest one is at either end of the
+    range of k that keeps both press counts non-negative. Buttons are (x step, y step, tokens).
+    """
+    x0, y0, a_tokens = button_a
+    x1, y1, b_tokens = button_b
+    xt, yt = prize
+
+    if (x0, y0) == (0, 0) and (x1, y1) == (0, 0):
+        return 0 if (xt, yt) == (0, 0) else None
+
+    direction_x, direction_y = (x0, y0) if (x0, y0) != (0, 0) else (x1, y1)
+    if (direction_x * yt) - (direction_y * xt) != 0:
+        return None
+
+    # The axis the direction moves along, at least one button has a non-zero step on it
+    if direction_x:
+        s0, s1, st = x0, x1, xt
+    else:
+        s0, s1, st = y0, y1, yt
+
+    g, s, t = get_extended_gcd(a=s0, b=s1)
+    if st % g:
+        return None
+
+    a0, b0 = s * (st // g), t * (st // g)
+    a_step, b_step = s1 // g, s0 // g
+
+    # Range of k keeping a >= 0 and b >= 0, None where a press count does not depend on k
+    k_min = -(a0 // a_step) if a_step else None
+    k_max = b0 // b_step if b_step else None
+    if (not a_step and a0 < 0) or (not b_step and b0 < 0):
+        return None
+    if k_min is not None and k_max is not None and k_min > k_max:
+        return None
+
+    slope = (a_tokens * a_step) - (b_tokens * b_step)
+    k = k_min if slope > 0 else k_max
+    if k is None:
+        # The cheap end is unbounded only if tokens do not change along it
+        k = k_max if k_min is None else k_min
+
+    a, b = a0 + (k * a_step), b0 - (k * b_step)
+    return (a_tokens * a) + (b_tokens * b)
+
+
+def get_minimum_tokens_batch(puzzles: list[Puzzle]) -> list[int | None]:
+    return [get_minimum_tokens(puzzle=puzzle) for puzzle in puzzles]
+
+
+def get_total_tokens(puzzles: list[Puzzle]) -> int:
+    return sum(tokens for tokens in get_minimum_tokens_batch(puzzles=puzzles) if tokens is not None)
+
+
+class PuzzleBatch:
+    """
+    Every machine of an input as NumPy columns, solved with a handful of vector operations.
+
+    Columns are int64 while the Cramer numerators and the token total fit in it, and object arrays
+    of Python ints for larger drifts. The rare machines with collinear buttons are left to the
+    scalar solver.
+    """
+
+    def __init__(
+            self,
+            x0: np.ndarray,
+            y0: np.ndarray,
+            a_tokens: np.ndarray,
+            x1: np.ndarray,
+            y1: np.ndarray,
+            b_tokens: np.ndarray,
+            xt: np.ndarray,
+            yt: np.ndarray,
+    ) -> None:
+        self.x0, self.y0, self.a_tokens = x0, y0, a_tokens
+        self.x1, self.y1, self.b_tokens = x1, y1, b_tokens
+        self.xt, self.yt = xt, yt
+
+    @staticmethod
+    def from_text(input_text: str, drift: int = 0) -> PuzzleBatch:
+        matches = PUZZLE_PATTERN.findall(input_text)
+        if not matches:
+            empty = np.zeros(0, dtype=np.int64)
+            return PuzzleBatch(empty, empty, empty, empty, empty, empty, empty, empty)
+
+        a_tokens = np.fromiter(
+            (BUTTON_TOKENS_MAPPING[match[0]] for match in matches),
+            dtype=np.int64,
+            count=len(matches),
+        )
+        b_tokens = np.fromiter(
+            (BUTTON_TOKENS_MAPPING[match[3]] for match in matches),
+            dtype=np.int64,
+            count=len(matches),
+        )
+        get_numbers = itemgetter(1, 2, 4, 5, 6, 7)
+        if LONG_NUMBER_PATTERN.search(input_text):
+            columns = np.array(
+                [[int(number) for number in get_numbers(match)] for match in matches],
+                dtype=object,
+            ).T
+        else:
+            # The numbers are joined back into one string, NumPy parses that far faster than `int`
+            numbers = ' '.join(map(' '.join, map(get_numbers, matches)))
+            columns = np.fromstring(numbers, dtype=np.int64, sep=' ').reshape(-1, 6).T
+        steps, prizes = columns[:4], columns[4:]
+
+        largest_step, largest_prize = int(steps.max()), int(prizes.max()) + drift
+        # A winnable machine presses each button at most prize times, so this bounds the token sum
+        largest_total = (int(a_tokens.max()) + int(b_tokens.max())) * largest_prize * len(matches)
+        if (
+                columns.dtype == object
+                or largest_step * max(largest_step, largest_prize) >= INT64_PRODUCT_LIMIT
+                or largest_total >= INT64_PRODUCT_LIMIT
+        ):
+            steps, prizes = steps.astype(object), prizes.astype(object)
+            a_tokens, b_tokens = a_tokens.astype(object), b_tokens.astype(object)
+        prizes = prizes + drift
+
+        x0, y0, x1, y1 = steps
+        xt, yt = prizes
+        return PuzzleBatch(x0=x0, y0=y0, a_tokens=a_tokens, x1=x1, y1=y1, b_tokens=b_tokens, xt=xt, yt=yt)
+
+    def __len__(self) -> int:
+        return len(self.xt)
+
+    def get_minimum_tokens(self) -> np.ndarray:
+        """
+        Minimum tokens of every machine, -1 where the prize cannot be won.
+        """
+        x0, y0, x1, y1, xt, yt = self.x0, self.y0, self.x1, self.y1, self.xt, self.yt
+
+        d = (x0 * y1) - (y0 * x1)
+        collinear = d == 0
+        safe_d = np.where(collinear, 1, d)
+
+        a_numerator = (xt * y1) - (x1 * yt)
+        b_numerator = (x0 * yt) - (y0 * xt)
+        a, b = a_numerator // safe_d, b_numerator // safe_d
+        valid = (
+            ~collinear
+            & (a_numerator % safe_d == 0)
+            & (b_numerator % safe_d == 0)
+            & (a >= 0)
+            & (b >= 0)
+        )
+
+        result = np.where(valid, (self.a_tokens * a) + (self.b_tokens * b), -1)
+        for index in np.flatnonzero(collinear):
+            tokens = get_collinear_minimum_tokens(
+                button_a=(int(x0[index]), int(y0[index]), int(self.a_tokens[index])),
+                button_b=(int(x1[index]), int(y1[index]), int(self.b_tokens[index])),
+                prize=(int(xt[index]), int(yt[index])),
+            )
+            result[index] = -1 if tokens is None else tokens
+
+        return result
+
+    def get_total_tokens(self) -> int:
+        tokens = self.get_minimum_tokens()
+        return int(tokens[tokens >= 0].sum())
@@ -0,0 +1,37 @@
+import argparse
+import random
+import sys
+
+MACHINES = 320
+MAX_PRESSES = 100
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+
+    machines = []
+    for _ in range(MACHINES * scale):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+
+        # Roughly half the prizes are reachable within the press limit
+        if rng.random() < 0.5:
+            a, b = rng.randint(0, MAX_PRESSES), rng.randint(0, MAX_PRESSES)
+            prize_x, prize_y = (a * ax) + (b * bx), (a * ay) + (b * by)
+        else:
+            prize_x, prize_y = rng.randint(1000, 20000), rng.randint(1000, 20000)
+
+        machines.append(
+            f'Button A: X+{ax}, Y+{ay}\n'
+            f'Button B: X+{bx}, Y+{by}\n'
+            f'Prize: X={prize_x}, Y={prize_y}\n',
+        )
+
+    return '\n'.join(machines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate claw machines.')
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(scale=args.scale, seed=args.seed))
@@ -1,128 +1,18 @@
-from __future__ import annotations
-
-import re
+import sys
 from pathlib import Path
 
-from pydantic import BaseModel, ConfigDict
-from tqdm import tqdm
-
-PUZZLE_PATTERN = re.compile(
-    pattern=r"Button (?P<button_name_1>.+): X\+(?P<button_x_step_1>\d+), Y\+(?P<button_y_step_1>\d+)\nButton (?P<button_name_2>.+): X\+(?P<button_x_step_2>\d+), Y\+(?P<button_y_step_2>\d+)\nPrize: X=(?P<prize_x>\d+), Y=(?P<prize_y>\d+)",
-)
-
-BUTTON_TOKENS_MAPPING = {
-    "A": 3,
-    "B": 1,
-}
-
-
-class Button(BaseModel):
-    name: str
-    tokens: int
-    x_step: int
-    y_step: int
-
-
-class Location(BaseModel):
-    x: int
-    y: int
-
-    model_config = ConfigDict(frozen=True)
-
-
-class Puzzle(BaseModel):
-    buttons: list[Button]
-    prize: Location
-
-
-class Solution:
-    def __init__(self, input_text: str) -> None:
-        self.puzzles: list[Puzzle]
-
-        self.setup_puzzles(input_text=input_text)
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-    def setup_puzzles(self, input_text: str) -> None:
-        puzzles = []
+from day13.engine import PuzzleBatch, get_puzzles, get_total_tokens  # noqa: E402
 
-        matches = PUZZLE_PATTERN.finditer(input_text)
-        for match in matches:
-            puzzles.append(
-                Puzzle(
-                    buttons=[
-                        Button(
-                            name=match.group("button_name_1"),
-                            tokens=BUTTON_TOKENS_MAPPING[match.group("button_name_1")],
-                            x_step=match.group("button_x_step_1"),
-                            y_step=match.group("button_y_step_1"),
-                        ),
-                        Button(
-                            name=match.group("button_name_2"),
-                            tokens=BUTTON_TOKENS_MAPPING[match.group("button_name_2")],
-                            x_step=match.group("button_x_step_2"),
-                            y_step=match.group("button_y_step_2"),
-                        ),
-                    ],
-                    prize=Location(
-                        x=int(match.group("prize_x")),
-                        y=int(match.group("prize_y")),
-                    )
-                ),
-            )
 
-        self.puzzles = puzzles
-
-    def get_p1_result(self) -> int:
-        result = 0
-        for puzzle in tqdm(self.puzzles):
-            minimum_tokens = self._get_minimum_tokens(
-                cache={},
-                location=Location(x=0, y=0),
-                puzzle=puzzle,
-            )
-            result += minimum_tokens if minimum_tokens else 0
-
-        return result
-
-    def _get_minimum_tokens(
-            self,
-            cache: dict[Location, int | None],
-            location: Location,
-            puzzle: Puzzle,
-    ) -> int | None:
-        if location in cache:
-            return cache[location]
-
-        if location.x == puzzle.prize.x and location.y == puzzle.prize.y:
-            cache[location] = 0
-            return 0
-
-        if location.x > puzzle.prize.x or location.y > puzzle.prize.y:
-            cache[location] = None
-            return None
-
-        next_steps_count = []
-        for button in puzzle.buttons:
-            minimum_tokens = self._get_minimum_tokens(
-                cache=cache,
-                location=Location(x=location.x + button.x_step, y=location.y + button.y_step),
-                puzzle=puzzle,
-            )
-            if minimum_tokens is not None:
-                next_steps_count.append(minimum_tokens + button.tokens)
-
-        if not next_steps_count:
-            cache[location] = None
-            return None
-
-        cache[location] = min(next_steps_count)
-        return cache[location]
-
-
-def main(input_path: Path) -> int:
+def main(input_path: Path, vectorized: bool = True) -> int:
     input_text = input_path.read_text()
+    if vectorized:
+        return PuzzleBatch.from_text(input_text=input_text).get_total_tokens()
 
-    solution = Solution(input_text=input_text)
-    result = solution.get_p1_result()
+    puzzles = get_puzzles(input_text=input_text)
+    result = get_total_tokens(puzzles=puzzles)
 
     return result
 
@@ -134,6 +24,19 @@ if __name__ == '__main__':
     print(f'Sample Result: {sample_result}')
     assert sample_result == 480
 
+    # Collinear buttons have no Cramer solution and are solved along their shared line instead
+    collinear_text = (
+        'Button A: X+2, Y+4\nButton B: X+1, Y+2\nPrize: X=7, Y=14\n\n'
+        'Button A: X+4, Y+2\nButton B: X+6, Y+3\nPrize: X=10, Y=5\n\n'
+        'Button A: X+4, Y+4\nButton B: X+1, Y+1\nPrize: X=8, Y=8\n\n'
+        'Button A: X+0, Y+0\nButton B: X+0, Y+0\nPrize: X=5, Y=0\n'
+    )
+    assert PuzzleBatch.from_text(input_text=collinear_text).get_minimum_tokens().tolist() == [7, 4, 6, -1]
+
+    # Token totals past int64 have to switch the batch to Python ints
+    large_text = 'Button A: X+1, Y+0\nButton B: X+0, Y+1\nPrize: X=999999999999999999, Y=999999999999999999\n\n' * 3
+    assert PuzzleBatch.from_text(input_text=large_text).get_total_tokens() == 11999999999999999988
+
     input_result = main(
         input_path=Path('data/input.txt'),
     )
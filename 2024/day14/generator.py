@@ -0,0 +1,29 @@
+import argparse
+import random
+import sys
+
+ROBOTS = 500
+WIDTH = 101
+HEIGHT = 103
+MAX_VELOCITY = 100
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+
+    lines = [f'{WIDTH} {HEIGHT}']
+    for _ in range(ROBOTS * scale):
+        lines.append(
+            f'p={rng.randrange(WIDTH)},{rng.randrange(HEIGHT)} '
+            f'v={rng.randint(-MAX_VELOCITY, MAX_VELOCITY)},{rng.randint(-MAX_VELOCITY, MAX_VELOCITY)}',
+        )
+
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a robot list.')
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(scale=args.scale, seed=args.seed))
@@ -1,25 +1,22 @@
 from __future__ import annotations
 
 import re
+import sys
 from collections import defaultdict
 from enum import StrEnum, auto
 from pathlib import Path
 
-from pydantic import BaseModel, ConfigDict
 from tqdm import tqdm
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.values import Coordinates  # noqa: E402
+
 ROBOT_PATTERN = re.compile(
     pattern=r"^p=(?P<pos_x>[\-]*\d+),(?P<pos_y>[\-]*\d+) v=(?P<vel_x>[\-]*\d+),(?P<vel_y>[\-]*\d+)$",
 )
 
 
-class Coordinates(BaseModel):
-    x: int
-    y: int
-
-    model_config = ConfigDict(frozen=True)
-
-
 class Quadrant(StrEnum):
     TOP_RIGHT = auto()
     TOP_LEFT = auto()
@@ -28,10 +25,13 @@ class Quadrant(StrEnum):
     MID_LINE = auto()
 
 
-class Robot(BaseModel):
-    id: int
-    position: Coordinates
-    velocity: Coordinates
+class Robot:
+    __slots__ = ('id', 'position', 'velocity')
+
+    def __init__(self, id: int, position: Coordinates, velocity: Coordinates) -> None:
+        self.id: int = id
+        self.position: Coordinates = position
+        self.velocity: Coordinates = velocity
 
 
 class Solution:
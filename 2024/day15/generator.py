@@ -0,0 +1,52 @@
+import argparse
+import math
+import random
+import sys
+
+SIZE = 50
+MOVES = 20000
+MOVES_PER_LINE = 1000
+WALL_DENSITY = 0.05
+BOX_DENSITY = 0.4
+
+
+def get_size(scale: int) -> int:
+    return max(4, round(SIZE * math.sqrt(scale)))
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = get_size(scale=scale)
+
+    matrix = []
+    for y in range(size):
+        if y == 0 or y == size - 1:
+            matrix.append(['#'] * size)
+            continue
+
+        row = ['#']
+        for _ in range(size - 2):
+            value = rng.random()
+            if value < WALL_DENSITY:
+                row.append('#')
+            elif value < WALL_DENSITY + BOX_DENSITY:
+                row.append('O')
+            else:
+                row.append('.')
+        row.append('#')
+        matrix.append(row)
+
+    matrix[size // 2][size // 2] = '@'
+
+    moves = ''.join(rng.choices('<>^v', k=MOVES * scale))
+    move_lines = [moves[i:i + MOVES_PER_LINE] for i in range(0, len(moves), MOVES_PER_LINE)]
+
+    return '\n'.join([''.join(row) for row in matrix] + [''] + move_lines) + '\n'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a warehouse and robot moves.')
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(scale=args.scale, seed=args.seed))
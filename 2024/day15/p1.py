@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import sys
 from enum import StrEnum
 from pathlib import Path
 
-from pydantic import BaseModel, ConfigDict
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.values import Coordinates as BaseCoordinates  # noqa: E402
 
 
 class Direction(StrEnum):
@@ -17,20 +20,8 @@ class Direction(StrEnum):
         return [Direction(value) for value in ''.join(move_lines)]
 
 
-class Coordinates(BaseModel):
-    x: int
-    y: int
-
-    model_config = ConfigDict(frozen=True)
-
-    def get_next_coordinates(self, direction: Direction) -> Coordinates:
-        next_x, next_y = {
-            Direction.DOWN: (self.x, self.y + 1),
-            Direction.UP: (self.x, self.y - 1),
-            Direction.RIGHT: (self.x + 1, self.y),
-            Direction.LEFT: (self.x - 1, self.y),
-        }[direction]
-        return Coordinates(x=next_x, y=next_y)
+class Coordinates(BaseCoordinates):
+    __slots__ = ()
 
     def get_gps_value(self) -> int:
         return (self.y * 100) + self.x
@@ -43,9 +34,12 @@ class MapObject(StrEnum):
     WALL = '#'
 
 
-class Map(BaseModel):
-    matrix: list[list[MapObject]]
-    robot: Coordinates
+class Map:
+    __slots__ = ('matrix', 'robot')
+
+    def __init__(self, matrix: list[list[MapObject]], robot: Coordinates) -> None:
+        self.matrix: list[list[MapObject]] = matrix
+        self.robot: Coordinates = robot
 
     @staticmethod
     def from_map_lines(map_lines: list[str]) -> Map:
@@ -0,0 +1,42 @@
+import argparse
+import math
+import random
+import sys
+from typing import Any
+
+SIZE = 71
+BYTES_RATIO = 0.68
+MIN_STEPS_RATIO = 0.2
+
+
+def get_size(scale: int) -> int:
+    return max(3, round(SIZE * math.sqrt(scale)))
+
+
+def get_kwargs(scale: int) -> dict[str, Any]:
+    size = get_size(scale=scale)
+    return {
+        'width': size - 1,
+        'height': size - 1,
+        'min_steps': round(size * size * MIN_STEPS_RATIO),
+    }
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = get_size(scale=scale)
+
+    # Bytes never fall on the start or the exit
+    cells = list(range(1, (size * size) - 1))
+    rng.shuffle(cells)
+    cells = cells[:round(size * size * BYTES_RATIO)]
+
+    return '\n'.join(f'{cell % size},{cell // size}' for cell in cells) + '\n'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate falling byte positions.')
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(scale=args.scale, seed=args.seed))
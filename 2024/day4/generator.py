@@ -0,0 +1,30 @@
+import argparse
+import math
+import random
+import sys
+
+SIZE = 140
+LETTERS = 'XMAS'
+
+
+def get_size(scale: int) -> int:
+    return max(4, round(SIZE * math.sqrt(scale)))
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = get_size(scale=scale)
+
+    lines = []
+    for _ in range(size):
+        lines.append(''.join(rng.choices(LETTERS, k=size)))
+
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a word search grid.')
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(scale=args.scale, seed=args.seed))
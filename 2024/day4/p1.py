@@ -1,6 +1,12 @@
+import sys
 from pathlib import Path
 
-from tqdm import tqdm
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.loader import map_array, map_grid  # noqa: E402
+from common.search import WordSearch  # noqa: E402
 
 ALL_DIRECTIONS = [
     (1, 0),
@@ -15,51 +21,40 @@ ALL_DIRECTIONS = [
 KEY = "XMAS"
 
 
-def get_matrix(lines: list[str]) -> list[list[str]]:
-    result = []
-    for row in lines:
-        result.append(list(row))
-
-    return result
-
-
-def get_matrix_value(matrix: list[list[str]], x: int, y: int) -> str | None:
-    if x < 0 or y < 0 or y >= len(matrix) or x >= len(matrix[0]):
-        return None
-
-    return matrix[y][x]
+def get_vectorized_xmas_count(array: np.ndarray) -> int:
+    height, width = array.shape
+    span = len(KEY) - 1
 
-
-def get_xmas_count(matrix: list[list[str]], start_x: int, start_y: int) -> int:
     result = 0
-    for direction in ALL_DIRECTIONS:
-        state = 0
-        x, y = start_x, start_y
-        while state < len(KEY):
-            value = get_matrix_value(matrix=matrix, x=x, y=y)
-            if value != KEY[state]:
-                break
-
-            x, y = x + direction[0], y + direction[1]
-            state += 1
-
-        if state == len(KEY):
-            result += 1
+    for dx, dy in ALL_DIRECTIONS:
+        # Start positions whose whole word stays inside the grid in this direction
+        y_start, y_end = max(0, -dy * span), height - max(0, dy * span)
+        x_start, x_end = max(0, -dx * span), width - max(0, dx * span)
+        if y_start >= y_end or x_start >= x_end:
+            continue
+
+        mask = np.ones((y_end - y_start, x_end - x_start), dtype=bool)
+        for state, key in enumerate(KEY.encode()):
+            shifted = array[
+                y_start + (dy * state):y_end + (dy * state),
+                x_start + (dx * state):x_end + (dx * state),
+            ]
+            mask &= shifted == key
+
+        result += int(np.count_nonzero(mask))
 
     return result
 
 
-def main(input_path: Path) -> int:
-    lines = input_path.read_text().splitlines()
-    matrix = get_matrix(lines=lines)
+def main(input_path: Path, vectorized: bool = True) -> int:
+    if vectorized:
+        array = map_array(input_path=input_path)
+        return get_vectorized_xmas_count(array=array)
 
-    result = 0
-    for y in tqdm(range(len(matrix))):
-        for x in range(len(matrix[y])):
-            xmas_count = get_xmas_count(matrix=matrix, start_x=x, start_y=y)
-            result += xmas_count
-
-    return result
+    grid = map_grid(input_path=input_path)
+    word_search = WordSearch(words=[KEY])
+    search_result = word_search.search(grid=grid)
+    return search_result.counts[KEY]
 
 
 if __name__ == '__main__':
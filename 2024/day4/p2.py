@@ -1,59 +1,67 @@
+import sys
 from pathlib import Path
 
+import numpy as np
 from tqdm import tqdm
 
-X_DIRECTIONS = [
-    (1, 1),
-    (1, -1),
-    (-1, 1),
-    (-1, -1),
-]
-CENTRAL_KEY = "A"
-WING_KEYS = {"M", "S"}
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from common.grid import Grid  # noqa: E402
+from common.loader import map_array, map_grid  # noqa: E402
 
-def get_matrix(lines: list[str]) -> list[list[str]]:
-    result = []
-    for row in lines:
-        result.append(list(row))
+CENTRAL_KEY = ord("A")
+WING_KEYS = {ord("M"), ord("S")}
 
-    return result
-
-
-def get_matrix_value(matrix: list[list[str]], x: int, y: int) -> str | None:
-    if x < 0 or y < 0 or y >= len(matrix) or x >= len(matrix[0]):
-        return None
-
-    return matrix[y][x]
 
+def get_xmas_count(grid: Grid, index: int) -> int:
+    cells = grid.cells
+    if cells[index] != CENTRAL_KEY:
+        return 0
 
-def get_xmas_count(matrix: list[list[str]], start_x: int, start_y: int) -> int:
-    if get_matrix_value(matrix, start_x, start_y) != CENTRAL_KEY:
+    # The wings are one row up and down, which only leaves the buffer on the first and last rows
+    if not grid.stride < index < grid.size - grid.stride - 1:
         return 0
 
     if {
-        get_matrix_value(matrix, start_x + 1, start_y - 1),
-        get_matrix_value(matrix, start_x - 1, start_y + 1),
+        cells[index + grid.up + grid.right],
+        cells[index + grid.down + grid.left],
     } != WING_KEYS:
         return 0
 
     if {
-        get_matrix_value(matrix, start_x - 1, start_y - 1),
-        get_matrix_value(matrix, start_x + 1, start_y + 1),
+        cells[index + grid.up + grid.left],
+        cells[index + grid.down + grid.right],
     } != WING_KEYS:
         return 0
 
     return 1
 
 
-def main(input_path: Path) -> int:
-    lines = input_path.read_text().splitlines()
-    matrix = get_matrix(lines=lines)
+def get_vectorized_xmas_count(array: np.ndarray) -> int:
+    m_key, s_key = sorted(WING_KEYS)
+
+    center = array[1:-1, 1:-1] == CENTRAL_KEY
+    top_left, bottom_right = array[:-2, :-2], array[2:, 2:]
+    top_right, bottom_left = array[:-2, 2:], array[2:, :-2]
+
+    first_wing = ((top_left == m_key) & (bottom_right == s_key)) | ((top_left == s_key) & (bottom_right == m_key))
+    second_wing = ((top_right == m_key) & (bottom_left == s_key)) | ((top_right == s_key) & (bottom_left == m_key))
+
+    return int(np.count_nonzero(center & first_wing & second_wing))
+
+
+def main(input_path: Path, vectorized: bool = True) -> int:
+    if vectorized:
+        array = map_array(input_path=input_path)
+        return get_vectorized_xmas_count(array=array)
+
+    grid = map_grid(input_path=input_path)
 
     result = 0
-    for y in tqdm(range(len(matrix))):
-        for x in range(len(matrix[y])):
-            xmas_count = get_xmas_count(matrix=matrix, start_x=x, start_y=y)
+    for y in tqdm(range(grid.height)):
+        start = grid.index(x=0, y=y)
+        for index in range(start, start + grid.width):
+            xmas_count = get_xmas_count(grid=grid, index=index)
             result += xmas_count
 
     return result
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Iterable
+
+from tqdm import tqdm
+
+EQUATION_TYPE = tuple[int, list[int]]
+
+# Left operand returned by `Operator.undo` when every left operand gives the result (0 * x == 0),
+# operands are never negative so it cannot be mistaken for a real one
+ANY_LEFT = -1
+
+
+@lru_cache(maxsize=4096)
+def get_digits_power(number: int) -> int:
+    result = 10
+    while result <= number:
+        result *= 10
+
+    return result
+
+
+class Operator(ABC):
+    symbol: str
+
+    @abstractmethod
+    def apply(self, left: int, right: int) -> int:
+        pass
+
+    @abstractmethod
+    def undo(self, result: int, right: int) -> int | None:
+        """
+        Return the left operand that gives `result` with `right`, `ANY_LEFT` when every one does,
+        or None when there is none.
+        """
+
+
+class AddOperator(Operator):
+    symbol = '+'
+
+    def apply(self, left: int, right: int) -> int:
+        return left + right
+
+    def undo(self, result: int, right: int) -> int | None:
+        # Operands are never negative
+        if result < right:
+            return None
+
+        return result - right
+
+
+class MultiplyOperator(Operator):
+    symbol = '*'
+
+    def apply(self, left: int, right: int) -> int:
+        return left * right
+
+    def undo(self, result: int, right: int) -> int | None:
+        if right == 0:
+            return ANY_LEFT if result == 0 else None
+
+        if result % right != 0:
+            return None
+
+        return result // right
+
+
+class ConcatOperator(Operator):
+    symbol = '||'
+
+    def apply(self, left: int, right: int) -> int:
+        return (left * get_digits_power(right)) + right
+
+    def undo(self, result: int, right: int) -> int | None:
+        digits_power = get_digits_power(right)
+        if result % digits_power != right:
+            return None
+
+        return result // digits_power
+
+
+ADD = AddOperator()
+MULTIPLY = MultiplyOperator()
+CONCAT = ConcatOperator()
+
+
+def get_equations(equation_lines: list[str]) -> list[EQUATION_TYPE]:
+    equations = []
+    for line in equation_lines:
+        target, numbers = line.split(": ")
+        target = int(target)
+        numbers = numbers.split()
+        equations.append((target, [int(x) for x in numbers]))
+
+    return equations
+
+
+class EquationSolver:
+    def __init__(self, operators: list[Operator]) -> None:
+        # Operators are tried in the given order, so put the ones that prune the most first
+        self.operators: list[Operator] = operators
+
+    def is_solvable(self, target: int, numbers: list[int], index: int | None = None) -> bool:
+        # Works backwards from the last number, undoing each operator only where that is possible
+        if index is None:
+            index = len(numbers) - 1
+
+        number = numbers[index]
+        if index == 0:
+            return target == number
+
+        for operator in self.operators:
+            left = operator.undo(result=target, right=number)
+            if left == ANY_LEFT:
+                # The numbers before always evaluate to some left operand
+                return True
+
+            if left is not None and self.is_solvable(left, numbers, index - 1):
+                return True
+
+        return False
+
+    def get_solvable_sum(self, equations: Iterable[EQUATION_TYPE]) -> int:
+        result = 0
+        for target, numbers in equations:
+            if self.is_solvable(
+                    target=target,
+                    numbers=numbers,
+            ):
+                result += target
+
+        return result
+
+    def solve(self, equations: list[EQUATION_TYPE], workers: int = 1, chunk_size: int = 1000) -> int:
+        if workers <= 1:
+            return self.get_solvable_sum(equations=tqdm(equations))
+
+        # Equations are independent, so chunks of them are summed in separate processes and the
+        # progress bar advances by a whole chunk as each one finishes
+        chunks = [equations[i:i + chunk_size] for i in range(0, len(equations), chunk_size)]
+        result = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor, tqdm(total=len(equations)) as progress:
+            futures = {executor.submit(self.get_solvable_sum, chunk): len(chunk) for chunk in chunks}
+            for future in as_completed(futures):
+                result += future.result()
+                progress.update(futures[future])
+
+        return result
@@ -0,0 +1,56 @@
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from day7.engine import ADD, CONCAT, MULTIPLY, Operator  # noqa: E402
+
+EQUATIONS = 850
+MIN_NUMBERS = 3
+MAX_NUMBERS = 12
+
+
+def get_number(rng: random.Random) -> int:
+    if rng.random() < 0.1:
+        return rng.randint(100, 999)
+
+    return rng.randint(1, 99)
+
+
+def get_target(rng: random.Random, numbers: list[int], operators: list[Operator]) -> int:
+    result = numbers[0]
+    for number in numbers[1:]:
+        result = rng.choice(operators).apply(left=result, right=number)
+
+    return result
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+
+    lines = []
+    for _ in range(EQUATIONS * scale):
+        numbers = [get_number(rng) for _ in range(rng.randint(MIN_NUMBERS, MAX_NUMBERS))]
+
+        # A third of the equations need `||`, a third only `+`/`*` and the rest are unlikely to be solvable
+        kind = rng.randrange(3)
+        if kind == 0:
+            target = get_target(rng=rng, numbers=numbers, operators=[ADD, MULTIPLY, CONCAT])
+        elif kind == 1:
+            target = get_target(rng=rng, numbers=numbers, operators=[ADD, MULTIPLY])
+        else:
+            target = get_target(rng=rng, numbers=numbers, operators=[ADD, MULTIPLY, CONCAT]) + rng.randint(1, 9)
+
+        lines.append(f'{target}: {" ".join(str(x) for x in numbers)}')
+
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate calibration equations.')
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(scale=args.scale, seed=args.seed))
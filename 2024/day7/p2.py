@@ -1,51 +1,19 @@
+import sys
 from pathlib import Path
 
-from tqdm import tqdm
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from day7.engine import ADD, CONCAT, MULTIPLY, EquationSolver, get_equations  # noqa: E402
 
-def get_equations(equation_lines: list[str]) -> list[tuple[int, list[int]]]:
-    equations = []
-    for line in equation_lines:
-        target, numbers = line.split(": ")
-        target = int(target)
-        numbers = numbers.split()
-        equations.append((target, [int(x) for x in numbers]))
+OPERATORS = [CONCAT, MULTIPLY, ADD]
 
-    return equations
 
-def is_equation_solvable(
-        target: int,
-        numbers: list[int],
-        current_value: int = 0,
-        is_first_number: bool = True,
-) -> bool:
-    if not numbers:
-        return current_value == target
-
-    plus_number = current_value + numbers[0]
-    multi_number = current_value * numbers[0] if not is_first_number else numbers[0]
-    concat_number = int(f'{current_value}{numbers[0]}')
-
-    with_plus = is_equation_solvable(target, numbers[1:], plus_number, False)
-    with_multi = is_equation_solvable(target, numbers[1:], multi_number, False)
-    with_concat = is_equation_solvable(target, numbers[1:], concat_number, False)
-
-    return with_plus or with_multi or with_concat
-
-
-def main(input_path: Path) -> int:
+def main(input_path: Path, workers: int = 1, chunk_size: int = 1000) -> int:
     equation_lines = input_path.read_text().splitlines()
     equations = get_equations(equation_lines=equation_lines)
 
-    result = 0
-    for target, numbers in tqdm(equations):
-        if is_equation_solvable(
-                target=target,
-                numbers=numbers,
-        ):
-            result += target
-
-    return result
+    solver = EquationSolver(operators=OPERATORS)
+    return solver.solve(equations=equations, workers=workers, chunk_size=chunk_size)
 
 
 if __name__ == '__main__':
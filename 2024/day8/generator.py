@@ -0,0 +1,32 @@
+import argparse
+import math
+import random
+import string
+import sys
+
+SIZE = 50
+ANTENNA_DENSITY = 0.02
+FREQUENCIES = string.ascii_letters + string.digits
+
+
+def get_size(scale: int) -> int:
+    return max(2, round(SIZE * math.sqrt(scale)))
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = get_size(scale=scale)
+
+    matrix = [['.'] * size for _ in range(size)]
+    for _ in range(round(size * size * ANTENNA_DENSITY)):
+        matrix[rng.randrange(size)][rng.randrange(size)] = rng.choice(FREQUENCIES)
+
+    return '\n'.join(''.join(row) for row in matrix) + '\n'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate an antenna map.')
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(scale=args.scale, seed=args.seed))
@@ -1,43 +1,34 @@
+import sys
 from collections import defaultdict
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def get_matrix(lines: list[str]) -> list[list[str]]:
-    result = []
-    for row in lines:
-        result.append(list(row))
+from common.grid import Grid  # noqa: E402
 
-    return result
-
-
-def is_antenna(value: str) -> bool:
-    return value.isalnum()
 
+def is_antenna(value: int) -> bool:
+    return chr(value).isalnum()
 
-def is_outside(matrix: list[list[str]], x: int, y: int) -> bool:
-    if y >= len(matrix) or y < 0:
-        return True
 
-    if x >= len(matrix[0]) or x < 0:
-        return True
+def is_outside(grid: Grid, x: int, y: int) -> bool:
+    return not grid.contains(x=x, y=y)
 
-    return False
 
-
-def get_antennas_dict(matrix: list[list[str]]) -> dict[str, list[tuple[int, int]]]:
+def get_antennas_dict(grid: Grid) -> dict[int, list[tuple[int, int]]]:
     result = defaultdict(list)
-    for i, row in enumerate(matrix):
-        for j, value in enumerate(row):
-            if not is_antenna(value):
-                continue
+    for index in grid.indices():
+        value = grid.cells[index]
+        if not is_antenna(value):
+            continue
 
-            result[value].append((j, i))
+        result[value].append(grid.position(index=index))
 
     return result
 
 
 def get_two_antenna_antinodes(
-        matrix: list[list[str]],
+        grid: Grid,
         antenna_location1: tuple[int, int],
         antenna_location2: tuple[int, int],
 ) -> set[tuple[int, int]]:
@@ -52,7 +43,7 @@ def get_two_antenna_antinodes(
         (x1 - dx, y1 - dy),
         (x2 + dx, y2 + dy),
     ]:
-        if is_outside(matrix=matrix, x=antinode_x, y=antinode_y):
+        if is_outside(grid=grid, x=antinode_x, y=antinode_y):
             continue
 
         result.add((antinode_x, antinode_y))
@@ -60,8 +51,8 @@ def get_two_antenna_antinodes(
     return result
 
 
-def get_antinodes(matrix: list[list[str]]) -> set[tuple[int, int]]:
-    antennas_dict = get_antennas_dict(matrix=matrix)
+def get_antinodes(grid: Grid) -> set[tuple[int, int]]:
+    antennas_dict = get_antennas_dict(grid=grid)
 
     result = set()
     for antenna_key in antennas_dict.keys():
@@ -69,7 +60,7 @@ def get_antinodes(matrix: list[list[str]]) -> set[tuple[int, int]]:
         for i in range(len(antenna_locations)):
             for j in range(i + 1, len(antenna_locations)):
                 antinodes = get_two_antenna_antinodes(
-                    matrix=matrix,
+                    grid=grid,
                     antenna_location1=antenna_locations[i],
                     antenna_location2=antenna_locations[j],
                 )
@@ -80,8 +71,8 @@ def get_antinodes(matrix: list[list[str]]) -> set[tuple[int, int]]:
 
 def main(input_path: Path) -> int:
     lines = input_path.read_text().splitlines()
-    matrix = get_matrix(lines=lines)
-    antinodes = get_antinodes(matrix=matrix)
+    grid = Grid.from_lines(lines=lines)
+    antinodes = get_antinodes(grid=grid)
     return len(antinodes)
 
 
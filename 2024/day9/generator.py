@@ -0,0 +1,28 @@
+import argparse
+import random
+import sys
+
+LENGTH = 19999
+DIGITS = '0123456789'
+FILE_DIGITS = '123456789'
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+
+    # Files alternate with free spaces and the map always ends with a file, without a newline
+    files = rng.choices(FILE_DIGITS, k=(LENGTH * scale) // 2 + 1)
+    spaces = rng.choices(DIGITS, k=len(files) - 1)
+
+    result = [''] * (len(files) + len(spaces))
+    result[::2] = files
+    result[1::2] = spaces
+    return ''.join(result)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a disk map.')
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(scale=args.scale, seed=args.seed))
@@ -1,62 +1,129 @@
+import sys
+from mmap import mmap
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def get_expanded_form(line: str) -> list[int]:
+from common.loader import map_file  # noqa: E402
+
+# File id, start block and size
+FILE_SPAN_TYPE = tuple[int, int, int]
+DIGIT_0 = ord('0')
+DIGIT_9 = ord('9')
+
+
+def get_file_spans(line: str) -> list[FILE_SPAN_TYPE]:
     result = []
     is_free_space = False
 
     id_index = 0
+    position = 0
     for v in line:
-        for i in range(int(v)):
-            result.append(id_index if not is_free_space else '.')
-
+        size = int(v)
         if not is_free_space:
+            result.append((id_index, position, size))
             id_index += 1
+
+        position += size
         is_free_space = not is_free_space
 
     return result
 
 
-def get_ordered_form(expanded_form: list[int]) -> list[int]:
-    i = 0
-    j = len(expanded_form) - 1
+def get_ordered_form(file_spans: list[FILE_SPAN_TYPE]) -> list[FILE_SPAN_TYPE]:
+    result = []
+
+    # Blocks of the last file are moved into the gaps from the left, `remaining` of them are left
+    j = len(file_spans) - 1
+    remaining = file_spans[j][2] if file_spans else 0
+    for i, (id_index, start, size) in enumerate(file_spans):
+        if i >= j:
+            if i == j:
+                result.append((id_index, start, remaining))
+            break
+
+        result.append((id_index, start, size))
+
+        gap_start = start + size
+        gap_end = file_spans[i + 1][1]
+        while gap_start < gap_end and j > i:
+            moved_size = min(remaining, gap_end - gap_start)
+            result.append((file_spans[j][0], gap_start, moved_size))
+            gap_start += moved_size
+            remaining -= moved_size
+            if remaining == 0:
+                j -= 1
+                remaining = file_spans[j][2]
+
+    return result
 
-    result = list(['*'] * len(expanded_form))
-    while i <= j:
-        if expanded_form[i] != '.':
-            result[i] = expanded_form[i]
-            i += 1
-            continue
 
-        if expanded_form[j] == '.':
-            result[j] = expanded_form[j]
-            j -= 1
-            continue
+def get_span_checksum(id_index: int, start: int, size: int) -> int:
+    # Sum of id * position over the span's blocks, as an arithmetic series
+    return id_index * ((start * size) + ((size * (size - 1)) // 2))
 
-        result[i] = expanded_form[j]
-        result[j] = '.'
-        i += 1
-        j -= 1
+
+def get_checksum(file_spans: list[FILE_SPAN_TYPE]) -> int:
+    result = 0
+    for id_index, start, size in file_spans:
+        result += get_span_checksum(id_index=id_index, start=start, size=size)
 
     return result
 
 
-def get_checksum(ordered_form: list[int]) -> int:
+def get_streamed_checksum(disk_map: bytes | mmap) -> int:
+    """
+    Same as compacting the file spans and summing them, but reads the digits directly from both
+    ends of the disk map: `i` walks forwards over files and the gaps after them, `j` walks
+    backwards over the files that fill those gaps.
+    """
+    length = len(disk_map)
+    while length and not DIGIT_0 <= disk_map[length - 1] <= DIGIT_9:
+        length -= 1
+
+    if not length:
+        return 0
+
     result = 0
-    for i, v in enumerate(ordered_form):
-        if v == '.':
-            continue
+    position = 0
 
-        result += i * v
+    # Files are on the even digits, and `remaining` blocks of file `j` are still to be moved
+    j = (length - 1) - ((length - 1) % 2)
+    remaining = disk_map[j] - DIGIT_0
+    i = 0
+    while i < j:
+        size = disk_map[i] - DIGIT_0
+        result += get_span_checksum(id_index=i // 2, start=position, size=size)
+        position += size
+
+        gap = disk_map[i + 1] - DIGIT_0
+        while gap and i < j:
+            moved_size = min(gap, remaining)
+            result += get_span_checksum(id_index=j // 2, start=position, size=moved_size)
+            position += moved_size
+            gap -= moved_size
+            remaining -= moved_size
+            if remaining == 0:
+                j -= 2
+                remaining = disk_map[j] - DIGIT_0
+
+        i += 2
+
+    if i == j:
+        result += get_span_checksum(id_index=j // 2, start=position, size=remaining)
 
     return result
 
 
-def main(input_path: Path) -> int:
+def main(input_path: Path, streaming: bool = True) -> int:
+    if streaming:
+        disk_map = map_file(input_path=input_path)
+        return get_streamed_checksum(disk_map=disk_map)
+
     line = input_path.read_text()
-    expanded_form = get_expanded_form(line=line)
-    ordered_form = get_ordered_form(expanded_form=expanded_form)
-    checksum = get_checksum(ordered_form=ordered_form)
+    file_spans = get_file_spans(line=line)
+    ordered_form = get_ordered_form(file_spans=file_spans)
+    checksum = get_checksum(file_spans=ordered_form)
     return checksum
 
 
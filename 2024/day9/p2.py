@@ -1,5 +1,10 @@
+import heapq
 from pathlib import Path
 
+MAX_SIZE = 9
+# File id, start block and size
+FILE_SPAN_TYPE = tuple[int, int, int]
+
 
 def get_compact_form(line: str) -> list[tuple[int | str, int]]:
     result = []
@@ -18,56 +23,50 @@ def get_compact_form(line: str) -> list[tuple[int | str, int]]:
     return result
 
 
-def get_ordered_form(compact_form: list[tuple[int | str, int]]) -> list[tuple[int | str, int]]:
-    result = []
-    i = 0
-    while i < len(compact_form):
-        id_index, size = compact_form[i]
-        if id_index != '.':
-            result.append((id_index, size))
-            i += 1
-            continue
-
-        j = len(compact_form) - 1
-        while j > i:
-            second_id_index, second_size = compact_form[j]
-            if second_id_index == '.':
-                j -= 1
-                continue
+def get_ordered_form(compact_form: list[tuple[int | str, int]]) -> list[FILE_SPAN_TYPE]:
+    files = []
+    # Start positions of the free spans, one min-heap per span size
+    free_spans: list[list[int]] = [[] for _ in range(MAX_SIZE + 1)]
 
-            if second_size > size:
-                j -= 1
-                continue
+    position = 0
+    for id_index, size in compact_form:
+        if id_index != '.':
+            files.append([id_index, position, size])
+        elif size:
+            # Positions only grow, so appending keeps each list a valid heap
+            free_spans[size].append(position)
 
-            break
+        position += size
 
-        selected_id, selected_size = compact_form[j]
-        result.append((selected_id, selected_size))
-        compact_form[j] = ('.', selected_size)
-        if selected_size < size:
-            compact_form.insert(i + 1, ('.', size - selected_size))
+    # Space freed by a moved file is never used again, since the files still to move are all on its left
+    for file in reversed(files):
+        id_index, start, size = file
 
-        i += 1
+        selected_size = None
+        for span_size in range(size, MAX_SIZE + 1):
+            spans = free_spans[span_size]
+            if not spans or spans[0] >= start:
+                continue
 
-    return result
+            if selected_size is None or spans[0] < free_spans[selected_size][0]:
+                selected_size = span_size
 
+        if selected_size is None:
+            continue
 
-def get_expanded_form(compact_form: list[tuple[int | str, int]]) -> list[int]:
-    result = []
-    for value, repeat in compact_form:
-        for i in range(repeat):
-            result.append(value)
+        span_start = heapq.heappop(free_spans[selected_size])
+        file[1] = span_start
+        if selected_size > size:
+            heapq.heappush(free_spans[selected_size - size], span_start + size)
 
-    return result
+    return [(id_index, start, size) for id_index, start, size in files]
 
 
-def get_checksum(expanded_form: list[int]) -> int:
+def get_checksum(file_spans: list[FILE_SPAN_TYPE]) -> int:
     result = 0
-    for i, v in enumerate(expanded_form):
-        if v == '.':
-            continue
-
-        result += i * v
+    for id_index, start, size in file_spans:
+        # Sum of id * position over the span's blocks, as an arithmetic series
+        result += id_index * ((start * size) + ((size * (size - 1)) // 2))
 
     return result
 
@@ -76,8 +75,7 @@ def main(input_path: Path) -> int:
     line = input_path.read_text()
     compact_form = get_compact_form(line=line)
     ordered_form = get_ordered_form(compact_form=compact_form)
-    expanded_form = get_expanded_form(compact_form=ordered_form)
-    checksum = get_checksum(expanded_form=expanded_form)
+    checksum = get_checksum(file_spans=ordered_form)
     return checksum
 
 
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import multiprocessing
+import os
+import re
+import signal
+import sys
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from enum import StrEnum, auto
+from multiprocessing.queues import SimpleQueue
+from pathlib import Path
+from typing import Any, Iterator
+
+from pydantic import BaseModel
+
+ROOT_PATH = Path(__file__).resolve().parent
+SOLUTION_PATTERN = re.compile(pattern=r"^day(?P<day>\d+)/p(?P<part>\d+)\.py$")
+
+# How often a parallel sweep checks on a run, and how long past its time limit it waits before
+# giving up on a worker that is stuck where the time limit cannot reach it
+BACKSTOP_POLL_INTERVAL = 0.1
+BACKSTOP_GRACE = 5.0
+
+# Runs that differ from the default `data/sample.txt` + `data/input.txt` pair, mirroring the
+# `__main__` blocks of each solution. A `None` entry means the solution has no such run.
+RUN_OVERRIDES: dict[str, dict[str, dict[str, Any] | None]] = {
+    'day12.p2': {
+        'sample': {'file_name': 'sample2.txt'},
+    },
+    'day14.p2': {
+        'sample': None,
+    },
+    'day17.p1': {
+        'sample': {'file_name': 'sample_1.txt'},
+        'input': {'file_name': 'input_1.txt'},
+    },
+    'day17.p2': {
+        'sample': {'file_name': 'sample_2.txt'},
+        'input': {'file_name': 'input_1.txt'},
+    },
+    'day18.p1': {
+        'sample': {'kwargs': {'width': 6, 'height': 6, 'min_steps': 12}},
+        'input': {'kwargs': {'width': 70, 'height': 70, 'min_steps': 1024}},
+    },
+    'day18.p2': {
+        'sample': {'kwargs': {'width': 6, 'height': 6}},
+        'input': {'kwargs': {'width': 70, 'height': 70}},
+    },
+}
+
+SAMPLE_RESULTS: dict[str, Any] = {
+    'day4.p1': 18,
+    'day4.p2': 9,
+    'day7.p1': 3749,
+    'day7.p2': 11387,
+    'day8.p1': 14,
+    'day8.p2': 34,
+    'day9.p1': 1928,
+    'day9.p2': 2858,
+    'day10.p1': 36,
+    'day10.p2': 81,
+    'day11.p1': 55312,
+    'day11.p2': 65601038650482,
+    'day12.p1': 1930,
+    'day12.p2': 368,
+    'day13.p1': 480,
+    'day13.p2': 875318608908,
+    'day14.p1': 12,
+    'day15.p1': 10092,
+    'day15.p2': 9021,
+    'day17.p1': '4,6,3,5,6,3,5,2,1,0',
+    'day17.p2': 117440,
+    'day18.p1': 22,
+    'day18.p2': '6,1',
+}
+
+
+class RunTimeoutError(Exception):
+    pass
+
+
+class RunKind(StrEnum):
+    SAMPLE = auto()
+    INPUT = auto()
+
+
+class Run(BaseModel):
+    solution: str
+    kind: RunKind
+    input_path: Path
+    kwargs: dict[str, Any] = {}
+    expected: Any = None
+
+    @property
+    def name(self) -> str:
+        return f'{self.solution}:{self.kind}'
+
+
+class RunResult(BaseModel):
+    run: Run
+    result: Any = None
+    elapsed: float = 0.0
+    error: str | None = None
+    timed_out: bool = False
+
+    @property
+    def status(self) -> str:
+        if self.timed_out:
+            return 'timeout'
+
+        if self.error is not None:
+            return 'error'
+
+        if self.run.expected is None:
+            return 'done'
+
+        return 'ok' if self.result == self.run.expected else 'mismatch'
+
+
+def discover_solutions(days: list[int] | None = None) -> list[str]:
+    solutions = []
+    for path in ROOT_PATH.glob('day*/p*.py'):
+        match = SOLUTION_PATTERN.match(path.relative_to(ROOT_PATH).as_posix())
+        if match is None:
+            continue
+
+        day, part = int(match.group('day')), int(match.group('part'))
+        if days and day not in days:
+            continue
+
+        solutions.append((day, part, f'day{day}.p{part}'))
+
+    return [solution for _, _, solution in sorted(solutions)]
+
+
+def get_runs(solution: str, kinds: list[RunKind]) -> list[Run]:
+    day = solution.split('.')[0]
+    overrides = RUN_OVERRIDES.get(solution, {})
+
+    runs = []
+    for kind in kinds:
+        override = overrides.get(kind, {})
+        if override is None:
+            continue
+
+        runs.append(
+            Run(
+                solution=solution,
+                kind=kind,
+                input_path=ROOT_PATH / day / 'data' / override.get('file_name', f'{kind}.txt'),
+                kwargs=override.get('kwargs', {}),
+                expected=SAMPLE_RESULTS.get(solution) if kind == RunKind.SAMPLE else None,
+            ),
+        )
+
+    return runs
+
+
+@contextlib.contextmanager
+def time_limit(seconds: float | None) -> Iterator[None]:
+    # Solutions are plain CPU-bound Python, so the only way to stop one (e.g. the open-ended
+    # search of day14.p2) without killing the worker is a SIGALRM interval timer. Its handler runs
+    # on the main thread between bytecodes, so a run stuck inside one long C call (a NumPy
+    # operation, a huge int multiplication) is only stopped once that call returns.
+    if not seconds:
+        yield
+        return
+
+    def raise_timeout(signum, frame):
+        raise RunTimeoutError(f'run exceeded {seconds}s')
+
+    previous_handler = signal.signal(signal.SIGALRM, raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def execute_run(run: Run, verbose: bool = False, timeout: float | None = None) -> RunResult:
+    if str(ROOT_PATH) not in sys.path:
+        sys.path.insert(0, str(ROOT_PATH))
+
+    start = time.perf_counter()
+    try:
+        module = importlib.import_module(run.solution)
+        with contextlib.ExitStack() as stack:
+            if not verbose:
+                devnull = stack.enter_context(open(os.devnull, 'w'))
+                stack.enter_context(contextlib.redirect_stdout(devnull))
+
+            start = time.perf_counter()
+            with time_limit(seconds=timeout):
+                result = module.main(input_path=run.input_path, **run.kwargs)
+            elapsed = time.perf_counter() - start
+    except RunTimeoutError as e:
+        return RunResult(run=run, elapsed=time.perf_counter() - start, error=str(e), timed_out=True)
+    except Exception:
+        return RunResult(run=run, error=traceback.format_exc())
+
+    return RunResult(run=run, result=result, elapsed=elapsed)
+
+
+def print_result(run_result: RunResult) -> None:
+    print(
+        f'{run_result.run.name:<16} {run_result.status:<8} '
+        f'{run_result.elapsed:>9.3f}s  {run_result.result if run_result.error is None else ""}',
+    )
+    if run_result.status == 'mismatch':
+        print(f'{"":<16} expected {run_result.run.expected}')
+    if run_result.status == 'error':
+        print(run_result.error)
+
+
+def execute_runs(
+        runs: list[Run],
+        workers: int,
+        verbose: bool = False,
+        timeout: float | None = None,
+) -> Iterator[RunResult]:
+    if workers <= 1:
+        for run in runs:
+            yield execute_run(run=run, verbose=verbose, timeout=timeout)
+        return
+
+    pending = runs
+    while pending:
+        worker_pids = multiprocessing.SimpleQueue()
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=record_worker_pid, initargs=(worker_pids,))
+        stalled_index = None
+        try:
+            futures = [
+                executor.submit(execute_run, run=run, verbose=verbose, timeout=timeout)
+                for run in pending
+            ]
+            # Collected in submission order so the report reads the same as a serial sweep
+            for index, (run, future) in enumerate(zip(pending, futures)):
+                run_result = wait_for_result(future=future, run=run, timeout=timeout)
+                yield run_result
+                if run_result.timed_out and not future.done():
+                    stalled_index = index
+                    break
+        finally:
+            if stalled_index is not None:
+                # The stuck worker would block the shutdown forever and it cannot be told apart
+                # from the others, so the whole pool is stopped and the later runs start over
+                while not worker_pids.empty():
+                    with contextlib.suppress(ProcessLookupError):
+                        os.kill(worker_pids.get(), signal.SIGTERM)
+            executor.shutdown(wait=stalled_index is None, cancel_futures=True)
+
+        pending = pending[stalled_index + 1:] if stalled_index is not None else []
+
+
+def record_worker_pid(worker_pids: SimpleQueue) -> None:
+    # The pool does not expose its processes, so every worker reports itself when it starts
+    worker_pids.put(os.getpid())
+
+
+def wait_for_result(future: Future, run: Run, timeout: float | None) -> RunResult:
+    if not timeout:
+        return future.result()
+
+    # Backstop for runs the in-process time limit cannot interrupt, counted from when the run
+    # was handed to a worker rather than from its submission
+    started = None
+    while True:
+        try:
+            return future.result(timeout=BACKSTOP_POLL_INTERVAL)
+        except FuturesTimeoutError:
+            now = time.perf_counter()
+            if started is None:
+                started = now if future.running() else None
+            elif now - started > timeout + BACKSTOP_GRACE:
+                return RunResult(
+                    run=run,
+                    elapsed=now - started,
+                    error=f'run exceeded {timeout}s and did not stop',
+                    timed_out=True,
+                )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Run every solution in a single process.')
+    parser.add_argument('--days', type=int, nargs='*', help='only run these days')
+    parser.add_argument('--kinds', type=RunKind, nargs='*', default=list(RunKind), help='sample and/or input')
+    parser.add_argument('--verbose', action='store_true', help='keep solution output and progress bars')
+    parser.add_argument('--workers', type=int, default=1, help='number of worker processes, 1 runs in-process')
+    parser.add_argument('--timeout', type=float, help='per-run time limit in seconds')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        os.environ.setdefault('TQDM_DISABLE', '1')
+
+    runs = []
+    for solution in discover_solutions(days=args.days):
+        runs.extend(get_runs(solution=solution, kinds=args.kinds))
+
+    start = time.perf_counter()
+    run_results = []
+    for run_result in execute_runs(runs=runs, workers=args.workers, verbose=args.verbose, timeout=args.timeout):
+        print_result(run_result=run_result)
+        run_results.append(run_result)
+
+    failed = [run_result for run_result in run_results if run_result.status in ('error', 'mismatch', 'timeout')]
+    print(f'{len(run_results)} runs, {len(failed)} failed, {time.perf_counter() - start:.3f}s total')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())